@@ -2,6 +2,8 @@ from .resources import icons  # noqa: F401
 from .resources import images  # noqa: F401
 from .resources.compile_icons import svg_path, png_path, ico_path  # noqa: F401
 from .widgets.button import Button  # noqa: F401
+from .widgets.painted_button import PaintedButton  # noqa: F401
+from .widgets.button_pool import ButtonPool  # noqa: F401
 from .widgets.image_box import ImageBox  # noqa: F401
 from .widgets.switch import SwitchControl  # noqa: F401
 from .widgets.tab_widget import TabWidget, TabBar  # noqa: F401
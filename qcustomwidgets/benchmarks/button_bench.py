@@ -0,0 +1,59 @@
+"""
+Construction cost of `Button` vs `PaintedButton` and label re-polishes of
+idle, repainted `Button`s.
+
+    python -m qcustomwidgets.benchmarks.button_bench [count]
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from PyQt6.QtCore import QObject
+from PyQt6.QtWidgets import QApplication, QWidget, QGridLayout
+from qcustomwidgets.widgets.button import Button
+from qcustomwidgets.widgets.painted_button import PaintedButton
+
+
+ICONS = [Path(__file__).parents[1] / 'assets' / 'svg' / 'dark.svg',
+         Path(__file__).parents[1] / 'assets' / 'svg' / 'light.svg']
+
+
+def measure(button_type: type, count: int) -> tuple[float, int, int]:
+    host = QWidget()
+    tracemalloc.start()
+    start: float = time.perf_counter()
+    for i in range(count):
+        button_type(f'button {i}', ICONS, parent=host, flat=True)
+    elapsed: float = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects: int = len(host.findChildren(QObject))
+    host.deleteLater()
+    return elapsed, objects, peak
+
+
+def idle_polishes(count: int, frames: int = 60) -> int:
+    host = QWidget()
+    layout = QGridLayout(host)
+    for i in range(count):
+        layout.addWidget(Button(f'button {i}', ICONS), i // 10, i % 10)
+    host.show()
+    QApplication.processEvents()
+    before: int = Button.label_polish_count
+    for _ in range(frames):
+        host.repaint()
+        QApplication.processEvents()
+    host.deleteLater()
+    return Button.label_polish_count - before
+
+
+if __name__ == '__main__':
+    app = QApplication([])
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f'{"type":<15}{"total, ms":>12}{"per item, us":>15}'
+          f'{"QObjects":>10}{"py peak, KiB":>15}')
+    for button_type in (Button, PaintedButton):
+        elapsed, objects, peak = measure(button_type, count)
+        print(f'{button_type.__name__:<15}{elapsed * 1e3:>12.1f}'
+              f'{elapsed / count * 1e6:>15.1f}{objects:>10}{peak / 1024:>15.1f}')
+    print(f'label re-polishes while idle: {idle_polishes(min(count, 100))}')
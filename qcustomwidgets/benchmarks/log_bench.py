@@ -0,0 +1,39 @@
+"""
+Sustained throughput of `LogBrowser.append_line`: lines are produced
+for a few seconds while the event loop keeps running, then the number of
+lines that reached the document per second is printed.
+
+    python -m qcustomwidgets.benchmarks.log_bench [seconds] [max_lines]
+"""
+import sys
+import time
+from PyQt6.QtWidgets import QApplication
+from qcustomwidgets.widgets.log_browser import LogBrowser
+
+
+def sustained(browser: LogBrowser, seconds: float,
+              batch: int = 500) -> tuple[int, float]:
+    produced: int = 0
+    start: float = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for _ in range(batch):
+            browser.append_line(f'{produced:>10} INFO  device 3: '
+                                f'register 0x{produced & 0xFFFF:04x} updated')
+            produced += 1
+        QApplication.processEvents()
+    browser.flush()
+    QApplication.processEvents()
+    return produced, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    app = QApplication([])
+    seconds: float = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    max_lines: int = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    browser = LogBrowser(max_lines)
+    browser.resize(800, 600)
+    browser.show()
+    produced, elapsed = sustained(browser, seconds)
+    print(f'{produced / elapsed:,.0f} lines/s over {elapsed:.1f} s, '
+          f'{browser.document().blockCount()} lines kept '  # type: ignore
+          f'(max_lines={max_lines})')
@@ -0,0 +1,80 @@
+"""
+`LogView` with many records: load time, repaint after scrolling to random
+positions, and a background level + regex filter pass with the longest
+event loop stall seen while it runs. Given a log file instead of a record
+count, the file is opened in file-backed mode and indexed first.
+
+    python -m qcustomwidgets.benchmarks.log_view_bench [records | path]
+"""
+import random
+import sys
+import time
+from PyQt6.QtWidgets import QApplication
+from qcustomwidgets.widgets.log_view import LogView
+
+
+LEVELS = ['TRACE', 'DEBUG', 'INFO', 'SUCCESS', 'WARNING', 'ERROR']
+
+
+def load(view: LogView, count: int, batch: int = 100_000) -> float:
+    start: float = time.perf_counter()
+    for first in range(0, count, batch):
+        view.append_records((LEVELS[i % 6], f'{i:>10} device {i % 17}: '
+                             f'register 0x{i & 0xFFFF:04x} updated')
+                            for i in range(first, min(count, first + batch)))
+        view.log_model.flush()
+    QApplication.processEvents()
+    return time.perf_counter() - start
+
+
+def index_file(view: LogView, path: str) -> tuple[float, float]:
+    """Seconds until the first rows are shown and until the whole file is
+    indexed."""
+    start: float = time.perf_counter()
+    view.open_file(path)
+    first: float = 0.0
+    while view.log_model._indexing:  # type: ignore
+        QApplication.processEvents()
+        if not first and view.log_model.rowCount():
+            first = time.perf_counter() - start
+        time.sleep(0.001)
+    return first, time.perf_counter() - start
+
+
+def scroll(view: LogView, frames: int = 100) -> float:
+    bar = view.verticalScrollBar()
+    start: float = time.perf_counter()
+    for _ in range(frames):
+        bar.setValue(random.randint(0, bar.maximum()))  # type: ignore
+        view.repaint()
+    return (time.perf_counter() - start) / frames
+
+
+def filter_pass(view: LogView) -> tuple[float, float, int]:
+    start: float = time.perf_counter()
+    view.set_filter(['WARNING', 'ERROR'], r'device 1[0-6]:')
+    stall: float = 0.0
+    while not view.log_model._filter_done:
+        tick: float = time.perf_counter()
+        QApplication.processEvents()
+        stall = max(stall, time.perf_counter() - tick)
+        time.sleep(0.001)
+    return time.perf_counter() - start, stall, view.log_model.rowCount()
+
+
+if __name__ == '__main__':
+    app = QApplication([])
+    source: str = sys.argv[1] if len(sys.argv) > 1 else '1000000'
+    view = LogView()
+    view.resize(800, 600)
+    view.show()
+    if source.isdigit():
+        print(f'load {int(source):,} records: {load(view, int(source)):.2f} s')
+    else:
+        first, total = index_file(view, source)
+        print(f'index {view.log_model.rowCount():,} lines: first rows after '
+              f'{first * 1e3:.0f} ms, all after {total:.2f} s')
+    print(f'scroll + repaint: {scroll(view) * 1e3:.2f} ms')
+    elapsed, stall, rows = filter_pass(view)
+    print(f'filter: {elapsed:.2f} s, {rows:,} rows, '
+          f'longest event loop stall {stall * 1e3:.1f} ms')
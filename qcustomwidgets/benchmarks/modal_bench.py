@@ -0,0 +1,49 @@
+"""
+Regression check for modal managers: showing many toasts must not create
+new managers or install more event filters on the parent.
+
+    python -m qcustomwidgets.benchmarks.modal_bench [count]
+"""
+import sys
+import time
+from PyQt6.QtWidgets import QApplication, QWidget
+from qcustomwidgets.widgets.modals import (ModalsManager, InformationModal,
+                                           ErrorModal)
+
+
+POSITIONS = ['top-right', 'bottom-right', 'top-center']
+
+
+def show_toasts(parent: QWidget, count: int) -> float:
+    start: float = time.perf_counter()
+    for i in range(count):
+        modal_type = ErrorModal if i % 2 else InformationModal
+        modal = modal_type(position=POSITIONS[i % len(POSITIONS)],
+                           title=f'toast {i}', description='description',
+                           parent=parent, animationDuration=0)
+        modal.show()
+        modal.close()
+        if i % 50 == 0:
+            QApplication.processEvents()
+    QApplication.processEvents()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    app = QApplication([])
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    parent = QWidget()
+    parent.resize(800, 600)
+    parent.show()
+    show_toasts(parent, len(POSITIONS))
+    filters: int = ModalsManager.installed_filters
+    managers: int = len(ModalsManager._instances)
+    elapsed: float = show_toasts(parent, count)
+    print(f'{count} toasts: {elapsed * 1e3:.1f} ms, '
+          f'{elapsed / count * 1e3:.2f} ms per toast')
+    print(f'managers: {managers} -> {len(ModalsManager._instances)}')
+    print(f'installed event filters: {filters} -> '
+          f'{ModalsManager.installed_filters}')
+    if ModalsManager.installed_filters != filters \
+            or len(ModalsManager._instances) != managers:
+        sys.exit('modal managers or event filters leaked')
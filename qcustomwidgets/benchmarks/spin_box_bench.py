@@ -0,0 +1,36 @@
+"""
+Cost of a register table: creating and showing `count` 64-bit register
+`SpinBox`es, and how many text widths were measured for them.
+
+    python -m qcustomwidgets.benchmarks.spin_box_bench [count]
+"""
+import sys
+import time
+from PyQt6.QtGui import QShortcut
+from PyQt6.QtWidgets import QApplication, QWidget, QGridLayout
+from qcustomwidgets.widgets.spin_box import SpinBox, _text_widths
+
+
+def register_table(count: int, columns: int = 8) -> tuple[QWidget, float, float]:
+    host = QWidget()
+    layout = QGridLayout(host)
+    start: float = time.perf_counter()
+    for i in range(count):
+        spin_box = SpinBox()
+        spin_box.set_register(64, mask=0xFFFF << 16 * (i % 4))
+        layout.addWidget(spin_box, i // columns, i % columns)
+    created: float = time.perf_counter() - start
+    start = time.perf_counter()
+    host.show()
+    QApplication.processEvents()
+    return host, created, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    app = QApplication([])
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    host, created, shown = register_table(count)
+    print(f'create {count} spin boxes: {created * 1e3:.1f} ms '
+          f'({created / count * 1e6:.0f} us each), show: {shown * 1e3:.1f} ms')
+    print(f'text widths measured: {len(_text_widths)}, '
+          f'shortcuts: {len(host.findChildren(QShortcut))}')
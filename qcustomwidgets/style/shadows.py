@@ -0,0 +1,194 @@
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QEvent, QObject, QRect, QRectF
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap, QPixmapCache
+from PyQt6.QtWidgets import (QWidget, QGraphicsScene, QGraphicsPixmapItem,
+                             QGraphicsBlurEffect)
+
+
+SHADOW_SPEC = tuple[int, int, QColor, tuple[int, int]]
+
+
+def _blur(image: QImage, radius: int) -> QImage:
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(image))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(radius)
+    effect.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+    result = QImage(image.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    result.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(result)
+    scene.render(painter, QRectF(result.rect()), QRectF(image.rect()))
+    painter.end()
+    return result
+
+
+def shadow_pixmap(blur_radius: int, corner_radius: int,
+                  color: QColor) -> QPixmap:
+    """
+    Nine-patch source of a blurred rounded rect shadow. The patch margins
+    are `blur_radius + corner_radius` pixels; the centre is one pixel wide
+    and is stretched by `draw_shadow`.
+    """
+    key: str = f'qcw-shadow:{blur_radius}:{corner_radius}:{color.rgba()}'
+    pixmap: QPixmap | None = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+    margin: int = blur_radius + corner_radius
+    size: int = margin * 2 + 1
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(color)
+    painter.drawRoundedRect(QRectF(blur_radius, blur_radius,
+                                   size - blur_radius * 2,
+                                   size - blur_radius * 2),
+                            corner_radius, corner_radius)
+    painter.end()
+    if blur_radius > 0:
+        image = _blur(image, blur_radius)
+    pixmap = QPixmap.fromImage(image)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def shadow_rect(rect: QRect, blur_radius: int,
+                offset: tuple[int, int] = (0, 0)) -> QRect:
+    return rect.translated(*offset).adjusted(-blur_radius, -blur_radius,
+                                             blur_radius, blur_radius)
+
+
+def draw_shadow(painter: QPainter, rect: QRect, blur_radius: int,
+                corner_radius: int, color: QColor,
+                offset: tuple[int, int] = (0, 0)) -> None:
+    """Paint the shadow of `rect` from its cached nine-patch pixmap."""
+    corner_radius = min(corner_radius, rect.width() // 2, rect.height() // 2)
+    pixmap: QPixmap = shadow_pixmap(blur_radius, corner_radius, color)
+    m: int = blur_radius + corner_radius
+    s: int = pixmap.width()
+    target: QRect = shadow_rect(rect, blur_radius, offset)
+    xs = (target.left(), target.left() + m, target.right() + 1 - m)
+    ys = (target.top(), target.top() + m, target.bottom() + 1 - m)
+    ws = (m, target.width() - m * 2, m)
+    hs = (m, target.height() - m * 2, m)
+    sxs = (0, m, s - m)
+    sws = (m, 1, m)
+    for row in range(3):
+        if hs[row] <= 0:
+            continue
+        for col in range(3):
+            if ws[col] <= 0:
+                continue
+            painter.drawPixmap(QRect(xs[col], ys[row], ws[col], hs[row]), pixmap,
+                               QRect(sxs[col], sxs[row], sws[col], sws[row]))
+
+
+class ShadowLayer(QWidget):
+    """
+    Transparent sibling stacked under shadowed widgets which paints their
+    shadows from cached pixmaps. There is one layer per parent widget, so
+    changing a shadow only swaps the pixmap used for the next paint.
+    """
+    def __init__(self, parent: QWidget) -> None:
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        self._shadows: dict[QWidget, SHADOW_SPEC] = {}
+        self._painted: dict[QWidget, QRect] = {}
+        parent.installEventFilter(self)
+        self.setGeometry(parent.rect())
+        self.lower()
+        self.show()
+
+    @classmethod
+    def of(cls, parent: QWidget) -> 'ShadowLayer':
+        layer: ShadowLayer | None = parent.findChild(
+            cls, options=Qt.FindChildOption.FindDirectChildrenOnly)
+        return layer or cls(parent)
+
+    def set_shadow(self, widget: QWidget, blur_radius: int, corner_radius: int,
+                   color: QColor, offset: tuple[int, int] = (0, 0)) -> None:
+        spec: SHADOW_SPEC = (blur_radius, corner_radius, color, offset)
+        old: SHADOW_SPEC | None = self._shadows.get(widget)
+        if old == spec:
+            return
+        self._shadows[widget] = spec
+        if old is None:
+            widget.installEventFilter(self)
+            self._restack()
+        self._refresh(widget)
+
+    def remove_shadow(self, widget: QWidget) -> None:
+        if self._shadows.pop(widget, None) is None:
+            return
+        if not sip.isdeleted(widget):
+            widget.removeEventFilter(self)
+        rect: QRect | None = self._painted.pop(widget, None)
+        if rect is not None:
+            self.update(rect)
+
+    def _restack(self) -> None:
+        parent = self.parentWidget()
+        if parent is None:
+            return
+        for child in parent.children():
+            if child in self._shadows:
+                self.stackUnder(child)  # type: ignore
+                break
+
+    def _refresh(self, widget: QWidget) -> None:
+        old: QRect | None = self._painted.pop(widget, None)
+        if old is not None:
+            self.update(old)
+        blur, _, _, offset = self._shadows[widget]
+        if widget.isVisible():
+            rect: QRect = shadow_rect(widget.geometry(), blur, offset)
+            self._painted[widget] = rect
+            self.update(rect)
+
+    def eventFilter(self, a0: QObject | None, a1: QEvent | None) -> bool:
+        if a1 is not None:
+            t = a1.type()
+            if a0 is self.parentWidget():
+                if t == QEvent.Type.Resize:
+                    self.setGeometry(self.parentWidget().rect())  # type: ignore
+            elif a0 in self._shadows:
+                if t in (QEvent.Type.Move, QEvent.Type.Resize,
+                         QEvent.Type.Show, QEvent.Type.Hide):
+                    self._refresh(a0)  # type: ignore
+                elif t == QEvent.Type.ParentChange:
+                    self.remove_shadow(a0)  # type: ignore
+        return super().eventFilter(a0, a1)
+
+    def paintEvent(self, a0) -> None:
+        painter = QPainter(self)
+        for widget, (blur, corner, color, offset) in list(self._shadows.items()):
+            if sip.isdeleted(widget):
+                self._shadows.pop(widget)
+                self._painted.pop(widget, None)
+                continue
+            rect: QRect | None = self._painted.get(widget)
+            if rect is None or (a0 and not rect.intersects(a0.rect())):
+                continue
+            draw_shadow(painter, widget.geometry(), blur, corner, color, offset)
+        painter.end()
+
+
+def update_shadow(widget: QWidget, blur_radius: int, corner_radius: int = 0,
+                  color: QColor = QColor(0, 0, 0, 100),
+                  offset: tuple[int, int] = (0, 0)) -> None:
+    """Set (or remove, when `blur_radius` is 0) the shadow of `widget`."""
+    parent: QWidget | None = widget.parentWidget()
+    if parent is None or widget.isWindow():
+        return
+    if blur_radius <= 0:
+        layer: ShadowLayer | None = parent.findChild(
+            ShadowLayer, options=Qt.FindChildOption.FindDirectChildrenOnly)
+        if layer is not None:
+            layer.remove_shadow(widget)
+        return
+    ShadowLayer.of(parent).set_shadow(widget, blur_radius, corner_radius,
+                                      color, offset)
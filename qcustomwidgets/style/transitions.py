@@ -0,0 +1,140 @@
+import time
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QObject, QTimer, QEasingCurve
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QWidget
+
+
+EASING_STEPS = 100
+FRAME_INTERVAL = 16
+
+
+def easing_table(curve: QEasingCurve.Type,
+                 steps: int = EASING_STEPS) -> tuple[float, ...]:
+    easing = QEasingCurve(curve)
+    return tuple(easing.valueForProgress(i / steps) for i in range(steps + 1))
+
+
+def _channel(begin, end) -> tuple[str, object, object] | None:
+    """Return (kind, begin, end) for values which can be blended."""
+    if isinstance(begin, (str, QColor)) and isinstance(end, (str, QColor)):
+        b, e = QColor(begin), QColor(end)
+        if b.isValid() and e.isValid():
+            return 'color', b.getRgb(), e.getRgb()
+    elif isinstance(begin, (int, float)) and isinstance(end, (int, float)):
+        return 'number', begin, end
+    elif isinstance(begin, tuple) and isinstance(end, tuple) \
+            and len(begin) == len(end):
+        return 'tuple', begin, end
+    return None
+
+
+class _Ticker(QObject):
+    """Single frame timer shared by every running `StyleTransition`."""
+    def __init__(self) -> None:
+        super().__init__()
+        self.running: set[StyleTransition] = set()
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(FRAME_INTERVAL)
+        self.timer.timeout.connect(self.tick)
+
+    def add(self, transition: 'StyleTransition') -> None:
+        self.running.add(transition)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def tick(self) -> None:
+        now: float = time.perf_counter()
+        for transition in list(self.running):
+            if sip.isdeleted(transition.widget) or not transition.step(now):
+                self.running.discard(transition)
+            if not sip.isdeleted(transition.widget):
+                transition.widget.update()
+        if not self.running:
+            self.timer.stop()
+
+
+_ticker: _Ticker | None = None
+
+
+def ticker() -> _Ticker:
+    global _ticker
+    if _ticker is None:
+        _ticker = _Ticker()
+    return _ticker
+
+
+class StyleTransition:
+    """
+    Interpolates a widget's style between two `styleDict` states. Numbers,
+    colors and offset tuples are blended along a precomputed easing table,
+    everything else switches at the start. An idle transition is not
+    registered on the ticker, so it costs nothing.
+    """
+    _tables: dict[QEasingCurve.Type, tuple[float, ...]] = {}
+
+    def __init__(self, widget: QWidget, duration: int = 150,
+                 curve: QEasingCurve.Type = QEasingCurve.Type.OutCubic) -> None:
+        self.widget: QWidget = widget
+        self.duration: int = duration
+        if curve not in self._tables:
+            self._tables[curve] = easing_table(curve)
+        self._easing: tuple[float, ...] = self._tables[curve]
+        self.style: dict = {}
+        self._target: dict = {}
+        self._start: float = 0
+        self._channels: list[tuple] = []
+
+    def jump(self, target: dict) -> None:
+        """Switch to `target` immediately."""
+        self._channels = []
+        self._target = dict(target)
+        self.style = dict(target)
+        ticker().running.discard(self)
+        self.widget.update()
+
+    def start(self, target: dict) -> None:
+        """Animate from the currently shown style to `target`."""
+        if self.duration <= 0 or not self.style:
+            self.jump(target)
+            return
+        self._target = dict(target)
+        self._channels = []
+        style: dict = dict(target)
+        for key, end in target.items():
+            begin = self.style.get(key, end)
+            if begin == end:
+                continue
+            channel = _channel(begin, end)
+            if channel is not None:
+                self._channels.append((key, *channel))
+                style[key] = begin
+        self.style = style
+        if not self._channels:
+            ticker().running.discard(self)
+            self.widget.update()
+            return
+        self._start = time.perf_counter()
+        ticker().add(self)
+
+    def is_running(self) -> bool:
+        return self in ticker().running
+
+    def step(self, now: float) -> bool:
+        progress: float = min(1.0, (now - self._start) * 1000 / self.duration)
+        if progress >= 1.0:
+            self.style = dict(self._target)
+            self._channels = []
+            return False
+        k: float = self._easing[int(progress * (len(self._easing) - 1))]
+        for key, kind, begin, end in self._channels:
+            if kind == 'number':
+                self.style[key] = begin + (end - begin) * k
+            else:
+                value = tuple(b + (e - b) * k for b, e in zip(begin, end))
+                if kind == 'color':
+                    self.style[key] = QColor(*(int(c) for c in value))
+                else:
+                    self.style[key] = tuple(int(v) for v in value)
+        return True
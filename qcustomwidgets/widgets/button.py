@@ -7,19 +7,88 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QAbstractButton,
-    QGraphicsDropShadowEffect,
     QApplication,
     QStackedLayout
 )
-from PyQt6.QtGui import QColor, QMouseEvent, QPainter, QPen, QBrush
+from PyQt6.QtGui import (QColor, QMouseEvent, QPainter, QPen, QBrush, QFont,
+                         QPalette)
 from qcustomwidgets.style.palettes import dark, light
+from qcustomwidgets.style.shadows import update_shadow
+from qcustomwidgets.style.transitions import StyleTransition
 from qcustomwidgets.widgets.image_box import ImageBox
 
 
 ICON_SOURCE = Sequence[ImageBox | str | Path] | ImageBox | str | Path
+QWIDGETSIZE_MAX = 16777215
+LABEL_CACHE_SIZE = 8
+
+
+def _hex(widget: QWidget, role: str, darker: int = 0, lighter: int = 0) -> str:
+    color: QColor = getattr(widget.palette(), role)().color()
+    if darker > 0:
+        return color.darker(darker).name()
+    if lighter > 0:
+        return color.lighter(lighter).name()
+    return color.name()
+
+
+def default_style(widget: QWidget, flat: bool) -> dict:
+    return {
+        "default": {
+            "background-color": f"{(_hex(widget, 'base'), 'transparent')[flat]}",
+            "border-color": f"{_hex(widget, ('dark', 'button')[flat])}",
+            "border-width": 1 if not flat else 0,
+            "border-radius": 21,
+            "font-family": None,
+            "font-size": 12,
+            "font-weight": "regular",
+            "color":f"{_hex(widget, 'text')}",
+            "drop-shadow-radius": 20 if not flat else 0,
+            "drop-shadow-offset": (0, 0),
+            "drop-shadow-alpha": 100,
+        },
+        "hover": {
+            "background-color": f"{_hex(widget, 'base')}",
+            "border-color": f"{_hex(widget, ('dark', 'button')[flat])}",
+            "border-width": 1 if not flat else 0,
+            "border-radius": 41 if not flat else 5,
+            "font-size": 12,
+            "font-weight": "regular",
+            "color": f"{_hex(widget, 'text')}",
+            "drop-shadow-radius": 30 if not flat else 0,
+            "drop-shadow-offset": (0, 0),
+            "drop-shadow-alpha": 100,
+        },
+        "press": {
+            "background-color": f"{_hex(widget, 'base', darker=200)}",
+            "border-color": f"{_hex(widget, ('dark', 'button')[flat])}",
+            "border-width": 1 if not flat else 0,
+            "border-radius": 11 if not flat else 5,
+            "font-size": 12,
+            "font-weight": "regular",
+            "color": f"{_hex(widget, 'text')}",
+            "drop-shadow-radius": 0,
+            "drop-shadow-offset": (0, 0),
+            "drop-shadow-alpha": 100,
+        },
+    }
+
+
+def update_style_palette(style: dict, widget: QWidget, flat: bool) -> None:
+    style["default"]["background-color"] = f"{(_hex(widget, 'button'), 'transparent')[flat]}"
+    style["default"]["border-color"] = f"{(_hex(widget, 'button'), 'transparent')[flat]}"
+    style["default"]["color"] = f"{_hex(widget, 'text')}"
+    style["hover"]["background-color"] = f"{_hex(widget, ('base', 'button')[flat], darker=130)}"
+    style["hover"]["border-color"] = f"{_hex(widget, ('dark', 'button')[flat])}"
+    style["hover"]["color"] = f"{_hex(widget, 'text')}"
+    style["press"]["background-color"] = f"{_hex(widget, ('base', 'button')[flat], darker=200)}"
+    style["press"]["border-color"] = f"{_hex(widget, ('dark', 'button')[flat])}"
+    style["press"]["color"] = f"{_hex(widget, 'text')}"
 
 
 class Button(QAbstractButton):
+    label_polish_count: int = 0
+
     def __init__(self, text="", icons: ICON_SOURCE | None = None,
                  parent=None, flat: bool = False,
                  iterate_icons: bool = False, tooltip: str | None = None,
@@ -47,6 +116,8 @@ class Button(QAbstractButton):
         self._icon_constant_color: bool = constant_color
         self._text: str = text
         self.label = QLabel(text)
+        self._label_key: tuple | None = None
+        self._label_cache: dict[tuple, tuple[QFont, QPalette]] = {}
         if not self._text:
             self.label.setVisible(False)
             if flat:
@@ -60,6 +131,7 @@ class Button(QAbstractButton):
                                       alignment=Qt.AlignmentFlag.AlignCenter)
             self.body_layot.addLayout(self.icons_stack)
         self._icons: list[ImageBox] = []
+        self._full_size_image: bool = full_size_image
         if icons is not None:
             if isinstance(icons, Iterable):
                 for _icon in icons:
@@ -67,52 +139,8 @@ class Button(QAbstractButton):
             else:
                 self._add_icon(icons, full_size_image)
 
-        self.shadow = QGraphicsDropShadowEffect()
-        self.shadow.setBlurRadius(0.8)
-        self.shadow.setColor(QColor(0, 0, 0))
-        self.shadow.setOffset(2, 2)
-
-        if not flat:
-            self.setGraphicsEffect(self.shadow)
-        self.styleDict: dict = {
-            "default": {
-                "background-color": f"{(self.palette_hex('base'), 'transparent')[flat]}",
-                "border-color": f"{self.palette_hex(('dark', 'button')[flat])}",
-                "border-width": 1 if not flat else 0,
-                "border-radius": 21,
-                "font-family": None,
-                "font-size": 12,
-                "font-weight": "regular",
-                "color":f"{self.palette_hex('text')}",
-                "drop-shadow-radius": 20 if not flat else 0,
-                "drop-shadow-offset": (0, 0),
-                "drop-shadow-alpha": 100,
-            },
-            "hover": {
-                "background-color": f"{self.palette_hex('base')}",
-                "border-color": f"{self.palette_hex(('dark', 'button')[flat])}",
-                "border-width": 1 if not flat else 0,
-                "border-radius": 41 if not flat else 5,
-                "font-size": 12,
-                "font-weight": "regular",
-                "color": f"{self.palette_hex('text')}",
-                "drop-shadow-radius": 30 if not flat else 0,
-                "drop-shadow-offset": (0, 0),
-                "drop-shadow-alpha": 100,
-            },
-            "press": {
-                "background-color": f"{self.palette_hex('base', darker=200)}",
-                "border-color": f"{self.palette_hex(('dark', 'button')[flat])}",
-                "border-width": 1 if not flat else 0,
-                "border-radius": 11 if not flat else 5,
-                "font-size": 12,
-                "font-weight": "regular",
-                "color": f"{self.palette_hex('text')}",
-                "drop-shadow-radius": 0,
-                "drop-shadow-offset": (0, 0),
-                "drop-shadow-alpha": 100,
-            },
-        }
+        self.styleDict: dict = default_style(self, flat)
+        self.transition = StyleTransition(self)
 
         self._hover = False
         self._press = False
@@ -136,14 +164,49 @@ class Button(QAbstractButton):
         icon.resizeEvent(None)
 
     def palette_hex(self, role: str, darker: int = 0, lighter: int = 0):
-        color: QColor = getattr(self.palette(), role)().color()
-        if darker > 0:
-            new_color = color.darker(darker)
-            return new_color.name()
-        if lighter > 0:
-            new_color = color.lighter(lighter)
-            return new_color.name()
-        return color.name()
+        return _hex(self, role, darker, lighter)
+
+    def reset(self, text: str = "", icons: ICON_SOURCE | None = None,
+              tooltip: str | None = None) -> None:
+        """Reconfigure a recycled button as if it was constructed anew.
+        Icon boxes are reused, so an unchanged icon source is not reloaded."""
+        self.setToolTip(tooltip)
+        self._text = text
+        self.label.setText(text)
+        self.label.setVisible(bool(text))
+        self.setMinimumSize(50, 25)
+        self.setMaximumSize(QWIDGETSIZE_MAX, QWIDGETSIZE_MAX)
+        self.setContentsMargins(0, 0, 0, 0)
+        if not text and self.is_flat:
+            self.setFixedSize(25, 25)
+        sources: list = []
+        if icons is not None:
+            if isinstance(icons, Iterable) and not isinstance(icons, str):
+                sources = list(icons)
+            else:
+                sources = [icons]
+        for icon in self._icons[len(sources):]:
+            self.icons_stack.removeWidget(icon)
+            icon.deleteLater()
+        del self._icons[len(sources):]
+        for i, source in enumerate(sources):
+            if i >= len(self._icons):
+                self._add_icon(source, self._full_size_image)
+            elif isinstance(source, ImageBox):
+                self.setIcon(source, i)
+            elif self._icons[i].source != str(source):
+                self._icons[i].set_source(source)
+            if not self._full_size_image:
+                self._icons[i].setFixedSize(18, 18)
+            else:
+                self._icons[i].setMinimumSize(0, 0)
+                self._icons[i].setMaximumSize(QWIDGETSIZE_MAX, QWIDGETSIZE_MAX)
+        if self._icons:
+            self.icons_stack.setCurrentIndex(0)
+        self._hover = False
+        self._press = False
+        self._is_active = False
+        self.changeEvent(QEvent(QEvent.Type.PaletteChange))
 
     def icon_index(self):
         return self.icons_stack.currentIndex()
@@ -154,15 +217,11 @@ class Button(QAbstractButton):
         if e:
             t = e.type()
             if t == e.Type.PaletteChange:
-                self.styleDict["default"]["background-color"] = f"{(self.palette_hex('button'), 'transparent')[self.is_flat]}"
-                self.styleDict["default"]["border-color"] = f"{(self.palette_hex('button'), 'transparent')[self.is_flat]}"
-                self.styleDict["default"]["color"] = f"{self.palette_hex('text')}"
-                self.styleDict["hover"]["background-color"] = f"{self.palette_hex(('base', 'button')[self.is_flat], darker=130)}"
-                self.styleDict["hover"]["border-color"] = f"{self.palette_hex(('dark', 'button')[self.is_flat])}"
-                self.styleDict["hover"]["color"] = f"{self.palette_hex('text')}"
-                self.styleDict["press"]["background-color"] = f"{self.palette_hex(('base', 'button')[self.is_flat], darker=200)}"
-                self.styleDict["press"]["border-color"] = f"{self.palette_hex(('dark', 'button')[self.is_flat])}"
-                self.styleDict["press"]["color"] = f"{self.palette_hex('text')}"
+                update_style_palette(self.styleDict, self, self.is_flat)
+                self._label_key = None
+                self._label_cache.clear()
+                self.transition.jump(self.styleDict[self.current_state()])
+                self.apply_shadow()
                 if self._icons and not self._icon_constant_color:
                     if self._is_active:
                         color: str = "#FFFFFF" if self.isDark() else '#000000'
@@ -170,10 +229,26 @@ class Button(QAbstractButton):
                         color = "#616161" if self.isDark() else "#898989"
                     for icon in self._icons:
                         icon.change_svg_color(color)
+            elif t == e.Type.ParentChange:
+                self.apply_shadow()
             elif t == e.Type.StyleChange:
                 # print('style changed')
                 ...
 
+    def set_active(self, active: bool) -> None:
+        """Mark the button as the active one of a group (e.g. the current tab)
+        and tint its icon accordingly."""
+        self._is_active = active
+        if self._icons and not self._icon_constant_color:
+            if active:
+                color: str = "#FFFFFF" if self.isDark() else '#000000'
+            else:
+                color = "#898989" if self.isDark() else '#616161'
+            self.set_current_icon_color(color)
+        self._hover = False
+        self.transition.start(self.styleDict[self.current_state()])
+        self.apply_shadow()
+
     def isDark(self) -> bool:
         base = self.palette().base().color().value()
         text = self.palette().text().color().value()
@@ -247,16 +322,22 @@ class Button(QAbstractButton):
     @override
     def mousePressEvent(self, e: QMouseEvent | None) -> None:
         self._press = True
+        self.transition.start(self.styleDict['press'])
+        self.apply_shadow()
         return super().mousePressEvent(e)
 
     @override
     def mouseReleaseEvent(self, e: QMouseEvent | None) -> None:
         self._press = False
+        self.transition.start(self.styleDict[self.current_state()])
+        self.apply_shadow()
         return super().mouseReleaseEvent(e)
 
     @override
     def enterEvent(self, event) -> None:
         self._hover = True
+        self.transition.start(self.styleDict[self.current_state()])
+        self.apply_shadow()
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         icon = self.current_icon()
         if icon and not self._is_active and not self._icon_constant_color:
@@ -267,6 +348,8 @@ class Button(QAbstractButton):
     @override
     def leaveEvent(self, a0) -> None:
         self._hover = False
+        self.transition.start(self.styleDict[self.current_state()])
+        self.apply_shadow()
         icon = self.current_icon()
         if icon and not self._is_active and not self._icon_constant_color:
             color: str = "#898989" if self.isDark() else '#616161'
@@ -282,23 +365,23 @@ class Button(QAbstractButton):
             return 'default'
 
     def animate_border_color(self, painter: QPainter):
-        pc = QColor(self.styleDict[self.current_state()]["border-color"])
+        pc = QColor(self.transition.style["border-color"])
         if self.is_flat:
             pw = 0
         else:
-            pw = self.styleDict[self.current_state()]["border-width"]
+            pw = self.transition.style["border-width"]
         pen = QPen(pc, pw)
         painter.setPen(pen)
         return painter
 
     def animate_background(self, painter: QPainter):
-        b = QColor(self.styleDict[self.current_state()]["background-color"])
+        b = QColor(self.transition.style["background-color"])
         brush = QBrush(b)
         painter.setBrush(brush)
         return painter
 
     def animate_border_corners(self, painter: QPainter):
-        r_: int = self.styleDict[self.current_state()]["border-radius"]
+        r_: int = self.transition.style["border-radius"]
         if r_ > self.height() / 2:
             r: int = self.height() // 2
         else:
@@ -306,43 +389,49 @@ class Button(QAbstractButton):
         painter.drawRoundedRect(1, 1, self.width() - 2, self.height() - 2, r, r)
 
     def animate_label(self):
-        fc = QColor(self.styleDict[self.current_state()]["color"])
-        plt = self.label.palette()
-        plt.setColor(self.label.foregroundRole(), fc)
-        self.label.setPalette(plt)
-
-        fs = self.styleDict[self.current_state()]["font-size"]
-        fnt = self.label.font()
-        fnt.setPixelSize(int(fs))
-        if self.styleDict["default"]["font-family"]:
-            fnt.setFamily(self.styleDict["default"]["font-family"])
-        self.label.setFont(fnt)
-
-    def paint_shadows(self):
-        dsr = self.styleDict[self.current_state()]["drop-shadow-radius"]
-        dso = self.styleDict[self.current_state()]["drop-shadow-offset"]
-        dsc = self.styleDict[self.current_state()]["drop-shadow-alpha"]
-        if dsr == 0:
-            self.shadow.setEnabled(False)
-        else:
-            self.shadow.setEnabled(True)
-            self.shadow.setBlurRadius(dsr)
-            self.shadow.setOffset(*dso)
-            self.shadow.setColor(QColor(0, 0, 0, dsc))
+        fc = QColor(self.transition.style["color"])
+        fs = int(self.transition.style["font-size"])
+        family: str | None = self.styleDict["default"]["font-family"]
+        key: tuple = (fc.rgba(), fs, family)
+        if key == self._label_key:
+            return
+        styling: tuple[QFont, QPalette] | None = self._label_cache.get(key)
+        if styling is None:
+            plt = QPalette(self.label.palette())
+            plt.setColor(self.label.foregroundRole(), fc)
+            fnt = QFont(self.label.font())
+            fnt.setPixelSize(fs)
+            if family:
+                fnt.setFamily(family)
+            styling = (fnt, plt)
+            if len(self._label_cache) < LABEL_CACHE_SIZE:
+                self._label_cache[key] = styling
+        self._label_key = key
+        self.label.setPalette(styling[1])
+        self.label.setFont(styling[0])
+        Button.label_polish_count += 1
+
+    def apply_shadow(self) -> None:
+        """Show the shadow of the state the button is heading to. The
+        shadow switches at once, so a transition never blurs new pixmaps."""
+        if self.is_flat:
+            return
+        style: dict = self.styleDict[self.current_state()]
+        update_shadow(self, int(style["drop-shadow-radius"]),
+                      int(style["border-radius"]),
+                      QColor(0, 0, 0, int(style["drop-shadow-alpha"])),
+                      style["drop-shadow-offset"])
 
     @override
     def paintEvent(self, e):
         pt = QPainter()
         pt.begin(self)
         pt.setRenderHint(QPainter.RenderHint.Antialiasing)
-        if not self.is_flat:
-            self.paint_shadows()
         self.animate_label()
         self.animate_border_color(pt)
         self.animate_background(pt)
         self.animate_border_corners(pt)
         pt.end()
-        self.update()
 
 
 class Widget(QWidget):
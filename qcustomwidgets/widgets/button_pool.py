@@ -0,0 +1,77 @@
+from typing import Callable
+from PyQt6 import sip
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QWidget
+from qcustomwidgets.widgets.button import Button, ICON_SOURCE
+
+
+class ButtonPool:
+    """
+    Factory of `Button`s sharing one constructor configuration (`flat`,
+    `side_margins`, ...). Released buttons are hidden and kept with their
+    icon boxes, so `acquire` usually only reconfigures an existing button.
+    """
+    def __init__(self, button_type: Callable[..., Button] = Button,
+                 max_size: int = 64, **options) -> None:
+        self.button_type: Callable[..., Button] = button_type
+        self.max_size: int = max_size
+        self.options: dict = options
+        self._free: list[Button] = []
+        self._warm_up_left: int = 0
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def _create(self) -> Button:
+        button: Button = self.button_type(**self.options)
+        button._pool = self  # type: ignore
+        return button
+
+    def acquire(self, text: str = "", icons: ICON_SOURCE | None = None,
+                tooltip: str | None = None,
+                parent: QWidget | None = None) -> Button:
+        while self._free:
+            button: Button = self._free.pop()
+            if not sip.isdeleted(button):
+                button.reset(text, icons, tooltip)
+                break
+        else:
+            button = self._create()
+            button.reset(text, icons, tooltip)
+        if parent is not None:
+            button.setParent(parent)
+        return button
+
+    def owns(self, button: QWidget) -> bool:
+        return getattr(button, '_pool', None) is self
+
+    def release(self, button: Button) -> bool:
+        """Take `button` back. Connections to its `pressed` signal are
+        dropped. Returns False if the button was not created by this pool
+        or the pool is full (the button is then left to its owner)."""
+        if not self.owns(button) or sip.isdeleted(button) \
+                or len(self._free) >= self.max_size or button in self._free:
+            return False
+        try:
+            button.pressed.disconnect()
+        except TypeError:
+            pass
+        button.hide()
+        button.setParent(None)
+        self._free.append(button)
+        return True
+
+    def warm_up(self, count: int, chunk: int = 8) -> None:
+        """Pre-create `count` buttons in chunks of `chunk` whenever the event
+        loop is idle."""
+        self._warm_up_left = min(count, self.max_size - len(self._free))
+
+        def step() -> None:
+            for _ in range(min(chunk, self._warm_up_left)):
+                self._free.append(self._create())
+                self._warm_up_left -= 1
+            if self._warm_up_left > 0:
+                QTimer.singleShot(0, step)
+
+        if self._warm_up_left > 0:
+            QTimer.singleShot(0, step)
@@ -1,9 +1,10 @@
 from pathlib import Path
 from typing_extensions import override
 from loguru import logger
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QRectF
 from PyQt6.QtWidgets import QLabel, QWidget
-from PyQt6.QtGui import QPixmap, QMovie, QImage, QIcon, QPainter, QColor
+from PyQt6.QtGui import (QPixmap, QMovie, QImage, QIcon, QPainter, QColor,
+                         QPixmapCache)
 from PyQt6.QtSvg import QSvgRenderer
 
 
@@ -12,6 +13,8 @@ T_FAST = Qt.TransformationMode.FastTransformation
 T_SMOOTH = Qt.TransformationMode.SmoothTransformation
 AR_NONE = Qt.AspectRatioMode.IgnoreAspectRatio
 AR_KEEP = Qt.AspectRatioMode.KeepAspectRatio
+MAX_SOURCE_PIXMAPS = 16
+_source_pixmaps: dict[str, QPixmap] = {}
 
 
 def svg_to_pixmap(svg_filename: str, width: int, height: int,
@@ -27,6 +30,55 @@ def svg_to_pixmap(svg_filename: str, width: int, height: int,
     return pixmap
 
 
+def cached_pixmap(source: str | Path, width: int, height: int,
+                  color: str = '', ratio: float = 1.0) -> QPixmap:
+    """Render `source` into a `width` x `height` pixmap (tinted with `color`
+    when given) and keep the result in QPixmapCache, so widgets sharing an
+    icon share one rendered pixmap instead of re-rendering it."""
+    source = str(source)
+    key: str = f'qcw:{source}:{width}x{height}@{ratio}:{color}'
+    pixmap: QPixmap | None = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+    w, h = max(1, round(width * ratio)), max(1, round(height * ratio))
+    pixmap = QPixmap(w, h)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    is_svg: bool = source.lower().endswith('.svg') or source.startswith(':svg/')
+    renderer: QSvgRenderer | None = QSvgRenderer(source) if is_svg else None
+    if renderer is not None and renderer.isValid():
+        size: QSize = renderer.defaultSize().scaled(w, h, AR_KEEP)
+        renderer.render(painter, QRectF((w - size.width()) / 2,
+                                        (h - size.height()) / 2,
+                                        size.width(), size.height()))
+    else:
+        image = load_pixmap(source).scaled(w, h, AR_KEEP, T_SMOOTH)
+        painter.drawPixmap((w - image.width()) // 2,
+                           (h - image.height()) // 2, image)
+    if color:
+        painter.setCompositionMode(painter.CompositionMode.CompositionMode_SourceIn)
+        painter.fillRect(pixmap.rect(), QColor(color))
+    painter.end()
+    pixmap.setDevicePixelRatio(ratio)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def load_pixmap(source: str) -> QPixmap:
+    """QPixmap(source) shared between image boxes. Decoded sources can be
+    large (the bundled SVGs are 800x800), so they are kept in a small dict
+    of their own instead of QPixmapCache, which only holds pixmaps at the
+    size they are displayed."""
+    pixmap: QPixmap | None = _source_pixmaps.get(source)
+    if pixmap is None:
+        pixmap = QPixmap(source)
+        if len(_source_pixmaps) >= MAX_SOURCE_PIXMAPS:
+            del _source_pixmaps[next(iter(_source_pixmaps))]
+        _source_pixmaps[source] = pixmap
+    return pixmap
+
+
 class ImageBox(QLabel):
     def __init__(self, source: SOURCE | None = None,
                  parent: QWidget | None = None,
@@ -42,6 +94,7 @@ class ImageBox(QLabel):
         self.keepAspectRatio: bool = keepAspectRatio
         self.smoothScale: bool = smoothScale
         self.origin_pixmap: QPixmap | None = None
+        self._color: str = ''
         self._movie: QMovie | None = None
         if isinstance(self.source, Path):
             self.source = str(self.source)
@@ -54,6 +107,7 @@ class ImageBox(QLabel):
     def set_source(self, source: SOURCE):
         self.source = source
         self.animated = False
+        self._color = ''
 
         if isinstance(self.source, Path):
             self.source = str(self.source)
@@ -66,7 +120,7 @@ class ImageBox(QLabel):
                 self.animated = True
                 self._movie = QMovie(self.source)
             else:
-                self.origin_pixmap = QPixmap(self.source)
+                self.origin_pixmap = load_pixmap(self.source)
         elif isinstance(self.source, QIcon):
             self.origin_pixmap = self.source.pixmap(self.size())
         elif isinstance(self.source, QPixmap):
@@ -93,6 +147,10 @@ class ImageBox(QLabel):
         ar: Qt.AspectRatioMode = (AR_NONE, AR_KEEP)[self.keepAspectRatio]
         if self.animated and self._movie:
             self._movie.setScaledSize(QSize(w, h))
+        elif isinstance(self.source, str) and (self._color or self.keepAspectRatio):
+            # file sources are rendered and cached at the displayed size
+            self.setPixmap(cached_pixmap(self.source, w, h, self._color,
+                                         self.devicePixelRatioF()))
         elif self.origin_pixmap:
             pixmap: QPixmap = self.origin_pixmap.scaled(w, h, transformMode=tr,
                                                         aspectRatioMode=ar)
@@ -100,6 +158,5 @@ class ImageBox(QLabel):
 
     def change_svg_color(self, new_color: str):
         if self.origin_pixmap and isinstance(self.source, str):
-            self.origin_pixmap = svg_to_pixmap(self.source, self.origin_pixmap.width(),
-                                               self.origin_pixmap.height(), new_color)
+            self._color = new_color
             self.resizeEvent(None)
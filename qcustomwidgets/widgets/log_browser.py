@@ -1,11 +1,104 @@
-from PyQt6 import QtWidgets, QtCore
+import logging
+from collections import deque
+from itertools import count
+from typing import Iterable
+from PyQt6 import QtWidgets, QtCore, QtGui
+
+
+FLUSH_INTERVAL = 16
+LEVEL_COLORS: dict[str, str] = {
+    'TRACE': '#8a8a8a',
+    'DEBUG': '#3a96dd',
+    'SUCCESS': '#16c60c',
+    'WARNING': '#c19c00',
+    'ERROR': '#e74856',
+    'CRITICAL': '#ff0000',
+}
+_formats: dict[str | None, QtGui.QTextCharFormat] = {}
+
+
+def level_format(level: str | None) -> QtGui.QTextCharFormat:
+    """Shared character format of a log level, plain for unknown levels."""
+    fmt: QtGui.QTextCharFormat | None = _formats.get(level)
+    if fmt is None:
+        fmt = QtGui.QTextCharFormat()
+        color: str | None = LEVEL_COLORS.get(level or '')
+        if color is not None:
+            fmt.setForeground(QtGui.QColor(color))
+        if level == 'CRITICAL':
+            fmt.setFontWeight(QtGui.QFont.Weight.Bold)
+        _formats[level] = fmt
+    return fmt
 
 
 class LogBrowser(QtWidgets.QTextBrowser):
-    def __init__(self) -> None:
+    """
+    Text browser for logs. Lines added with `append_line(s)` or
+    `append_records` are buffered and written at most once per frame as
+    plain text colored by level, and the document is capped at `max_lines`
+    blocks: the oldest lines are dropped.
+    """
+    def __init__(self, max_lines: int = 10000) -> None:
         super().__init__()
         self.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
+        self.setUndoRedoEnabled(False)
+        self._pending: deque[tuple[str | None, str]] = deque()
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self.flush)
+        self.set_max_lines(max_lines)
+
+    def set_max_lines(self, max_lines: int) -> None:
+        """Keep at most `max_lines` lines, 0 means unlimited."""
+        self.max_lines: int = max_lines
+        self.document().setMaximumBlockCount(max_lines)  # type: ignore
+        self._pending = deque(self._pending, maxlen=max_lines or None)
+
+    def append_line(self, text: str, level: str | None = None) -> None:
+        self._pending.append((level, text))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def append_lines(self, lines: Iterable[str]) -> None:
+        self.append_records((None, line) for line in lines)
+
+    def append_records(self, records: Iterable[tuple[str | None, str]]) -> None:
+        """Add (level, text) pairs."""
+        self._pending.extend(records)
+        if self._pending and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write the buffered lines with one edit."""
+        if not self._pending:
+            return
+        records: list[tuple[str | None, str]] = list(self._pending)
+        self._pending.clear()
+        bar: QtWidgets.QScrollBar = self.verticalScrollBar()  # type: ignore
+        follow: bool = bar.value() >= bar.maximum()
+        document: QtGui.QTextDocument = self.document()  # type: ignore
+        cursor = QtGui.QTextCursor(document)
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        if not document.isEmpty():
+            cursor.insertBlock()
+        start: int = 0
+        # one insert per run of lines with the same level
+        for i in range(1, len(records) + 1):
+            if i == len(records) or records[i][0] != records[start][0]:
+                text: str = '\n'.join(text for _, text in records[start:i])
+                cursor.insertText(text if i == len(records) else text + '\n',
+                                  level_format(records[start][0]))
+                start = i
+        cursor.endEditBlock()
+        if follow:
+            bar.setValue(bar.maximum())
+
+    def clear(self) -> None:
+        self._pending.clear()
+        super().clear()
 
     def show_context_menu(self, point):
         menu = self.createStandardContextMenu()
@@ -15,4 +108,109 @@ class LogBrowser(QtWidgets.QTextBrowser):
             if ret:
                 obj = ret.objectName()
                 if obj == 'clear':
-                    self.clear()
\ No newline at end of file
+                    self.clear()
+
+
+class LogSink(QtCore.QObject):
+    """
+    Feeds log records from any thread into a `LogBrowser` (or a `LogView`,
+    anything with `append_records`). Records go to a bounded deque, so
+    producers never wait for the GUI: when it is full the oldest records
+    are dropped and counted. A timer in the GUI thread moves up to `batch`
+    records per tick into the browser.
+
+    Usable as a loguru sink (``logger.add(sink)``) or, through `handler`,
+    with the standard `logging` module.
+    """
+    def __init__(self, browser: LogBrowser, capacity: int = 10000,
+                 interval: int = 50, batch: int = 5000) -> None:
+        super().__init__(browser)
+        self.browser: LogBrowser = browser
+        self.batch: int = batch
+        self._queue: deque[tuple[str | None, str]] = deque(maxlen=capacity)
+        # producers only touch the deque and this counter, both update
+        # atomically, so the dropped count is derived in the GUI thread:
+        # appended - popped - queued
+        self._appended = count()
+        self._counter_reads: int = 0
+        self._popped: int = 0
+        self._reported: int = 0
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.drain)
+        self._timer.start()
+
+    def put(self, text: str, level: str | None = None) -> None:
+        """Queue a line, safe to call from any thread."""
+        self._queue.append((level, text))
+        next(self._appended)
+
+    @property
+    def dropped(self) -> int:
+        """Records dropped since the last summary line. GUI thread only."""
+        return max(0, self._dropped_total() - self._reported)
+
+    def _dropped_total(self) -> int:
+        # reading the counter advances it, the reads are subtracted again
+        appended: int = next(self._appended) - self._counter_reads
+        self._counter_reads += 1
+        return appended - self._popped - len(self._queue)
+
+    def __call__(self, message: str) -> None:
+        # loguru passes the formatted line with its record attached
+        record: dict | None = getattr(message, 'record', None)
+        level: str | None = record['level'].name if record else None
+        self.put(message.rstrip('\n'), level)
+
+    def handler(self, level: int = logging.NOTSET) -> logging.Handler:
+        return _LogSinkHandler(self, level)
+
+    def drain(self) -> None:
+        records: list[tuple[str | None, str]] = []
+        dropped: int = self._dropped_total()
+        if dropped > self._reported:
+            records.append(('WARNING', f'... {dropped - self._reported} '
+                                       'log records dropped'))
+            self._reported = dropped
+        queue = self._queue
+        for _ in range(min(self.batch, len(queue))):
+            records.append(queue.popleft())
+            self._popped += 1
+        if records:
+            self.browser.append_records(records)
+
+
+class _LogSinkHandler(logging.Handler):
+    def __init__(self, sink: LogSink, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.sink: LogSink = sink
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.sink.put(self.format(record), record.levelname)
+        except Exception:
+            self.handleError(record)
+
+
+if __name__ == '__main__':
+    import threading
+    import time
+    from loguru import logger
+    app = QtWidgets.QApplication([])
+    browser = LogBrowser()
+    browser.resize(800, 600)
+    sink = LogSink(browser)
+    logger.add(sink, format='{time:HH:mm:ss.SSS} {level:<8} {message}',
+               level='TRACE')
+
+    def produce() -> None:
+        levels = ['TRACE', 'DEBUG', 'INFO', 'SUCCESS', 'WARNING', 'ERROR']
+        i = 0
+        while True:
+            logger.log(levels[i % len(levels)], f'message {i}')
+            i += 1
+            time.sleep(0.001)
+
+    threading.Thread(target=produce, daemon=True).start()
+    browser.show()
+    app.exec()
@@ -0,0 +1,694 @@
+import mmap
+import os
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from itertools import accumulate, islice, repeat
+from operator import add
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+from typing_extensions import override
+from PyQt6 import QtWidgets, QtCore, QtGui
+from PyQt6.QtCore import Qt, QModelIndex, pyqtSignal, pyqtSlot
+from qcustomwidgets.widgets.log_browser import LEVEL_COLORS, FLUSH_INTERVAL
+
+
+LEVELS: list[str | None] = [None, 'TRACE', 'DEBUG', 'INFO', 'SUCCESS',
+                            'WARNING', 'ERROR', 'CRITICAL']
+LEVEL_PATTERN = re.compile(rb'\b(TRACE|DEBUG|INFO|SUCCESS|WARNING|ERROR|CRITICAL)\b')
+FILTER_CHUNK = 65536
+INDEX_CHUNK = 1 << 22
+EXPORT_CHUNK = 1 << 24
+_LEVEL_NUMBERS: dict[bytes, int] = {level.encode(): i
+                                    for i, level in enumerate(LEVELS) if level}
+
+
+def line_level(line: bytes) -> int:
+    """Level number of a log line, taken from the first level name near
+    its start."""
+    match = LEVEL_PATTERN.search(line, 0, 80)
+    return _LEVEL_NUMBERS[match.group(1)] if match else 0
+
+
+class LogModel(QtCore.QAbstractListModel):
+    """
+    Log records stored column-wise in compact arrays: timestamps, level
+    numbers and offsets into one shared UTF-8 text buffer. Text is only
+    decoded for the rows a view asks for.
+
+    `set_filter` keeps the records matching a level set and/or a regular
+    expression. The scan runs in a background thread over the stored
+    records and inserts matching rows chunk by chunk, records added
+    meanwhile are picked up by the same scan.
+    """
+    TimestampRole = Qt.ItemDataRole.UserRole + 1
+    LevelRole = Qt.ItemDataRole.UserRole + 2
+    filterProgress = pyqtSignal(int, int)
+    _filterChunk = pyqtSignal(int, object, int, bool)
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._times = array('d')
+        self._levels = array('b')
+        self._offsets = array('Q', [0])
+        self._text = bytearray()
+        self._pending: list[tuple[float, int, str]] = []
+        self._first: int = 0
+        self._rows: array | None = None
+        self._generation: int = 0
+        self._scanned: int = 0
+        self._filter_done: bool = True
+        self._level_mask: frozenset[int] | None = None
+        self._pattern: re.Pattern[bytes] | None = None
+        self._brushes: dict[int, QtGui.QBrush] = {
+            LEVELS.index(level): QtGui.QBrush(QtGui.QColor(color))
+            for level, color in LEVEL_COLORS.items()}
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self.flush)
+        self._filterChunk.connect(self._on_filter_chunk)
+
+    def record_count(self) -> int:
+        return len(self._levels)
+
+    def record_bytes(self, record: int) -> bytes:
+        return bytes(self._text[self._offsets[record]:self._offsets[record + 1]])
+
+    def record_level(self, record: int) -> int:
+        return self._levels[record]
+
+    def record_time(self, record: int) -> float | None:
+        return self._times[record]
+
+    def is_filtered(self) -> bool:
+        return self._rows is not None
+
+    def record_index(self, row: int) -> int:
+        """Index of the record shown at `row`."""
+        return self._rows[row] if self._rows is not None else self._first + row
+
+    def text(self, record: int) -> str:
+        return self.record_bytes(record).decode('utf-8', 'replace')
+
+    def record(self, record: int) -> tuple[float | None, str | None, str]:
+        return (self.record_time(record), LEVELS[self.record_level(record)],
+                self.text(record))
+
+    @staticmethod
+    def level_number(level: str | None) -> int:
+        return LEVELS.index(level) if level in LEVELS else 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        if self._rows is not None:
+            return len(self._rows)
+        return self.record_count() - self._first
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        record: int = self.record_index(index.row())
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.text(record)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._brushes.get(self.record_level(record))
+        if role == self.TimestampRole:
+            return self.record_time(record)
+        if role == self.LevelRole:
+            return LEVELS[self.record_level(record)]
+        return None
+
+    def append(self, text: str, level: str | None = None,
+               timestamp: float | None = None) -> None:
+        self._pending.append((time.time() if timestamp is None else timestamp,
+                              self.level_number(level), text))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def append_records(self, records: Iterable[tuple[str | None, str]]) -> None:
+        """Add (level, text) pairs, same as `LogBrowser.append_records`."""
+        now: float = time.time()
+        self._pending.extend((now, self.level_number(level), text)
+                             for level, text in records)
+        if self._pending and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Store the buffered records and announce the new rows once."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        first: int = len(self._levels)
+        times, levels, texts = zip(*pending)
+        encoded: list[bytes] = [text.encode('utf-8') for text in texts]
+        self._offsets.extend(islice(accumulate(map(len, encoded),
+                                               initial=len(self._text)), 1, None))
+        self._text += b''.join(encoded)
+        self._times.extend(times)
+        self._levels.extend(levels)
+        self._records_added(first)
+
+    def _records_added(self, first: int) -> None:
+        """Show the records stored from index `first` on."""
+        if self._rows is None:
+            if self.record_count() > first:
+                self.beginInsertRows(QModelIndex(), first - self._first,
+                                     self.record_count() - self._first - 1)
+                self.endInsertRows()
+        elif self._filter_done:
+            self._match_tail()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._generation += 1
+        self._pending = []
+        self._times = array('d')
+        self._levels = array('b')
+        self._offsets = array('Q', [0])
+        self._text = bytearray()
+        if self._rows is not None:
+            self._rows = array('Q')
+        self._scanned = 0
+        self._filter_done = True
+        self.endResetModel()
+
+    def set_filter(self, levels: Iterable[str | None] | None = None,
+                   pattern: str | None = None,
+                   flags: re.RegexFlag = re.IGNORECASE) -> None:
+        """Show only records with one of `levels` whose text matches
+        `pattern`; without both every record is shown."""
+        self.flush()
+        self._generation += 1
+        self._level_mask = None if levels is None else \
+            frozenset(self.level_number(level) for level in levels)
+        self._pattern = re.compile(pattern.encode('utf-8'), flags) \
+            if pattern else None
+        self.beginResetModel()
+        if self._level_mask is None and self._pattern is None:
+            self._rows = None
+            self._filter_done = True
+        else:
+            self._rows = array('Q')
+            self._scanned = self._first
+            self._filter_done = False
+            threading.Thread(target=self._scan, daemon=True,
+                             args=(self._generation, self._first,
+                                   self._level_mask, self._pattern)).start()
+        self.endResetModel()
+
+    def _filter_limit(self) -> int:
+        """Number of records a filter may look at."""
+        return self.record_count()
+
+    def _match(self, start: int, end: int, level_mask: frozenset[int] | None,
+               pattern: re.Pattern[bytes] | None) -> array:
+        """Indexes of the records in [start, end) passing the filter."""
+        levels, offsets, text = self._levels, self._offsets, self._text
+        records: Iterable[int] = range(start, end)
+        if level_mask is not None:
+            records = [i for i, level in enumerate(levels[start:end], start)
+                       if level in level_mask]
+        if pattern is not None:
+            search = pattern.search
+            records = [i for i in records
+                       if search(text[offsets[i]:offsets[i + 1]]) is not None]
+        return array('Q', records)
+
+    def _scan(self, generation: int, start: int,
+              level_mask: frozenset[int] | None,
+              pattern: re.Pattern[bytes] | None) -> None:
+        while generation == self._generation:
+            limit: int = self._filter_limit()
+            end: int = min(limit, start + FILTER_CHUNK)
+            found: array = self._match(start, end, level_mask, pattern)
+            self._filterChunk.emit(generation, found, end, end == limit)
+            if end == limit:
+                return
+            start = end
+
+    @pyqtSlot(int, object, int, bool)
+    def _on_filter_chunk(self, generation: int, found: array, end: int,
+                         done: bool) -> None:
+        if generation != self._generation or self._rows is None:
+            return
+        if found:
+            first: int = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(found) - 1)
+            self._rows.extend(found)
+            self.endInsertRows()
+        self._scanned = end
+        self.filterProgress.emit(end, self._filter_limit())
+        if done:
+            self._filter_done = True
+            self._match_tail()
+
+    def _match_tail(self) -> None:
+        """Filter records stored after the background scan finished."""
+        if self._rows is None:
+            return
+        limit: int = self._filter_limit()
+        found: array = self._match(self._scanned, limit,
+                                   self._level_mask, self._pattern)
+        self._scanned = limit
+        if found:
+            first: int = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(found) - 1)
+            self._rows.extend(found)
+            self.endInsertRows()
+
+    def export(self, path: str | Path, rows: Iterable[int] | None = None) -> int:
+        """Write the records shown at `rows`, every shown row by default, to
+        `path` one per line. Returns the number of lines written."""
+        if rows is None:
+            rows = range(self.rowCount())
+        count: int = 0
+        with open(path, 'wb') as file:
+            chunk: list[bytes] = []
+            for row in rows:
+                chunk.append(self.record_bytes(self.record_index(row)))
+                if len(chunk) == FILTER_CHUNK:
+                    file.write(b'\n'.join(chunk) + b'\n')
+                    count += len(chunk)
+                    chunk = []
+            if chunk:
+                file.write(b'\n'.join(chunk) + b'\n')
+                count += len(chunk)
+        return count
+
+
+class LogFileModel(LogModel):
+    """
+    Read-only `LogModel` over a log file of any size. The file is memory
+    mapped and only the start offset of every line is kept; a background
+    thread builds that index so the first lines show up at once. Lines
+    are decoded when displayed and their level is guessed from the level
+    name in the line.
+
+    The file size is polled every `poll_interval` ms: appended data is
+    mapped and indexed from the last known line on (``tail -f``), a file
+    that shrank is indexed again from the start. Once the open file is
+    read to the end and `path` names another file (rotated by rename),
+    that file is opened and indexed instead.
+    """
+    _indexChunk = pyqtSignal(int, object, int, bool)
+
+    def __init__(self, path: str | Path, parent: QtCore.QObject | None = None,
+                 poll_interval: int = 500) -> None:
+        super().__init__(parent)
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        self._map: mmap.mmap | bytes = b''
+        # maps replaced while a background thread may still read them
+        self._retired: list[mmap.mmap] = []
+        self._readers: int = 0
+        self._readers_lock = threading.Lock()
+        self._file_generation: int = 0
+        self._indexed: int = 0
+        self._indexing: bool = False
+        self._indexChunk.connect(self._on_index_chunk)
+        self._poll_timer = QtCore.QTimer(self)
+        self._poll_timer.setInterval(poll_interval)
+        self._poll_timer.timeout.connect(self.poll)
+        self._poll_timer.start()
+        # a lambda, bound methods of a destroyed object are not called
+        self.destroyed.connect(lambda: self._release())
+        self.poll()
+
+    @override
+    def record_count(self) -> int:
+        partial: bool = self._indexed > self._offsets[-1]
+        return len(self._offsets) - 1 + partial
+
+    @override
+    def record_bytes(self, record: int) -> bytes:
+        end: int = self._offsets[record + 1] \
+            if record + 1 < len(self._offsets) else self._indexed
+        return self._map[self._offsets[record]:end].rstrip(b'\r\n')
+
+    @override
+    def record_level(self, record: int) -> int:
+        start: int = self._offsets[record]
+        end: int = self._offsets[record + 1] \
+            if record + 1 < len(self._offsets) else self._indexed
+        return line_level(self._map[start:min(end, start + 80)])
+
+    @override
+    def record_time(self, record: int) -> float | None:
+        return None
+
+    @override
+    def append(self, text: str, level: str | None = None,
+               timestamp: float | None = None) -> None:
+        raise TypeError(f'{self.path} is shown read-only')
+
+    @override
+    def append_records(self, records: Iterable[tuple[str | None, str]]) -> None:
+        raise TypeError(f'{self.path} is shown read-only')
+
+    @override
+    def _filter_limit(self) -> int:
+        # a partial last line is filtered once it is complete
+        return len(self._offsets) - 1
+
+    @override
+    def _match(self, start: int, end: int, level_mask: frozenset[int] | None,
+               pattern: re.Pattern[bytes] | None) -> array:
+        line = self.record_bytes
+        if level_mask is not None and 0 not in level_mask:
+            # find lines naming one of the levels in C, check only those
+            probe: re.Pattern[bytes] = re.compile(b'|'.join(
+                LEVELS[n].encode() for n in sorted(level_mask)))  # type: ignore
+            records: Iterable[int] = [
+                i for i in self._probe(start, end, probe)
+                if line_level(line(i)) in level_mask]
+        elif level_mask is not None:
+            records = [i for i in range(start, end)
+                       if line_level(line(i)) in level_mask]
+        elif start < end:
+            # split the whole chunk at once instead of slicing line by line
+            search = pattern.search  # type: ignore
+            lines: list[bytes] = self._map[self._offsets[start]:
+                                           self._offsets[end] - 1].split(b'\n')
+            return array('Q', (i for i, text in enumerate(lines, start)
+                               if search(text.rstrip(b'\r')) is not None))
+        else:
+            records = []
+        if pattern is not None:
+            records = [i for i in records if pattern.search(line(i)) is not None]
+        return array('Q', records)
+
+    def _probe(self, start: int, end: int,
+               probe: re.Pattern[bytes]) -> Iterator[int]:
+        """Lines in [start, end) containing a match of `probe`, each once."""
+        if start >= end:
+            return
+        offsets, data = self._offsets, self._map
+        last: int = offsets[end]
+        match = probe.search(data, offsets[start], last)
+        while match is not None:
+            index: int = bisect_right(offsets, match.start(), start, end + 1) - 1
+            yield index
+            if index + 1 >= end:
+                return
+            match = probe.search(data, offsets[index + 1], last)
+
+    @override
+    def clear(self) -> None:
+        """Hide the lines read so far, new lines keep coming in."""
+        self.beginResetModel()
+        self._generation += 1
+        self._first = len(self._offsets) - 1
+        if self._rows is not None:
+            self._rows = array('Q')
+            self._scanned = self._first
+            self._filter_done = True
+        self.endResetModel()
+
+    def poll(self) -> None:
+        """Pick up data appended to the file since the last call."""
+        self._close_retired()
+        if self._indexing:
+            return
+        try:
+            opened: os.stat_result = os.fstat(self._file.fileno())
+        except (OSError, ValueError):
+            return
+        size: int = opened.st_size
+        if size == len(self._map) and self._rotated(opened):
+            self._reopen()
+            size = os.fstat(self._file.fileno()).st_size
+        if size < len(self._map):
+            self._reset()
+        if size > len(self._map):
+            self._retire(self._map)
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._indexing = True
+            threading.Thread(target=self._index, daemon=True,
+                             args=(self._file_generation, self._map,
+                                   self._offsets[-1], len(self._map))).start()
+
+    def _rotated(self, opened: os.stat_result) -> bool:
+        try:
+            current: os.stat_result = os.stat(self.path)
+        except OSError:
+            # renamed away and not created again yet
+            return False
+        return (current.st_ino, current.st_dev) != (opened.st_ino, opened.st_dev)
+
+    def _reopen(self) -> None:
+        try:
+            file = open(self.path, 'rb')
+        except OSError:
+            return
+        self._file.close()
+        self._file = file
+        self._reset()
+
+    def _release(self) -> None:
+        self._file_generation += 1
+        self._generation += 1
+        self._retire(self._map)
+        self._map = b''
+        self._file.close()
+        self._close_retired()
+
+    def _retire(self, data: mmap.mmap | bytes) -> None:
+        if isinstance(data, mmap.mmap):
+            self._retired.append(data)
+
+    def _close_retired(self) -> None:
+        """Close the replaced maps once no background thread reads them."""
+        with self._readers_lock:
+            if self._readers:
+                return
+            for data in self._retired:
+                data.close()
+            self._retired.clear()
+
+    @contextmanager
+    def _reading(self) -> Iterator[None]:
+        with self._readers_lock:
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._readers_lock:
+                self._readers -= 1
+
+    def _reset(self) -> None:
+        self.beginResetModel()
+        self._file_generation += 1
+        self._generation += 1
+        self._retire(self._map)
+        self._map = b''
+        self._offsets = array('Q', [0])
+        self._indexed = 0
+        self._first = 0
+        if self._rows is not None:
+            self._rows = array('Q')
+            self._scanned = 0
+            self._filter_done = True
+        self.endResetModel()
+
+    @override
+    def _scan(self, generation: int, start: int,
+              level_mask: frozenset[int] | None,
+              pattern: re.Pattern[bytes] | None) -> None:
+        with self._reading():
+            super()._scan(generation, start, level_mask, pattern)
+
+    def _index(self, generation: int, data: mmap.mmap, start: int,
+               end: int) -> None:
+        with self._reading():
+            self._index_chunks(generation, data, start, end)
+
+    def _index_chunks(self, generation: int, data: mmap.mmap, start: int,
+                      end: int) -> None:
+        while generation == self._file_generation:
+            stop: int = min(end, start + INDEX_CHUNK)
+            lines: list[bytes] = data[start:stop].split(b'\n')
+            # start of the line after every newline of the chunk
+            found = array('Q', islice(accumulate(
+                map(add, map(len, lines[:-1]), repeat(1)), initial=start), 1, None))
+            self._indexChunk.emit(generation, found, stop, stop == end)
+            if stop == end:
+                return
+            start = stop
+
+    @pyqtSlot(int, object, int, bool)
+    def _on_index_chunk(self, generation: int, found: array, end: int,
+                        done: bool) -> None:
+        if generation != self._file_generation:
+            return
+        if done:
+            self._indexing = False
+        first: int = self.record_count()
+        if first > len(self._offsets) - 1 and self._rows is None:
+            # the partial last line grew or got its newline
+            index: QModelIndex = self.index(first - 1 - self._first)
+            self._offsets.extend(found)
+            self._indexed = end
+            self.dataChanged.emit(index, index)
+        else:
+            self._offsets.extend(found)
+            self._indexed = end
+        self._records_added(first)
+
+    @override
+    def export(self, path: str | Path, rows: Iterable[int] | None = None) -> int:
+        if rows is not None or self._rows is not None:
+            return super().export(path, rows)
+        # every line is shown: copy the mapped bytes as they are
+        start: int = self._offsets[self._first]
+        with open(path, 'wb') as file:
+            for offset in range(start, self._indexed, EXPORT_CHUNK):
+                file.write(self._map[offset:min(self._indexed, offset + EXPORT_CHUNK)])
+            if self._indexed > start and self._map[self._indexed - 1:self._indexed] != b'\n':
+                file.write(b'\n')
+        return self.rowCount()
+
+
+class LogView(QtWidgets.QTableView):
+    """
+    Virtualized log viewer over a `LogModel`: one stretched column without
+    headers or grid and fixed row heights, so scrolling, appending and
+    filtering cost the same for a thousand or ten million records — only
+    the visible rows are painted. Use `LogBrowser` for rich text; `LogSink`
+    feeds both through `append_records`. `open_file` shows a log file
+    instead, following what is appended to it; records appended meanwhile
+    are kept in `live_model` and shown again by `close_file`.
+    """
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.live_model: LogModel = LogModel(self)
+        self.log_model: LogModel = self.live_model
+        self.setModel(self.log_model)
+        self.log_model.rowsAboutToBeInserted.connect(self._remember_bottom)
+        self.log_model.rowsInserted.connect(self._follow)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        rows: QtWidgets.QHeaderView = self.verticalHeader()  # type: ignore
+        rows.hide()
+        rows.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        columns: QtWidgets.QHeaderView = self.horizontalHeader()  # type: ignore
+        columns.hide()
+        columns.setStretchLastSection(True)
+        self._update_row_height()
+        self.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
+        self.customContextMenuRequested.connect(self.show_context_menu)
+        self._at_bottom: bool = True
+
+    def open_file(self, path: str | Path, poll_interval: int = 500) -> None:
+        """Show the log file at `path` instead of the appended records."""
+        self._set_log_model(LogFileModel(path, self, poll_interval))
+
+    def close_file(self) -> None:
+        if self.log_model is not self.live_model:
+            self._set_log_model(self.live_model)
+
+    def _set_log_model(self, model: LogModel) -> None:
+        old: LogModel = self.log_model
+        old.rowsAboutToBeInserted.disconnect(self._remember_bottom)
+        old.rowsInserted.disconnect(self._follow)
+        self.log_model = model
+        self.setModel(model)
+        model.rowsAboutToBeInserted.connect(self._remember_bottom)
+        model.rowsInserted.connect(self._follow)
+        if old is not self.live_model:
+            old.deleteLater()
+
+    def _update_row_height(self) -> None:
+        self.verticalHeader().setDefaultSectionSize(  # type: ignore
+            self.fontMetrics().height() + 2)
+
+    @override
+    def changeEvent(self, e: QtCore.QEvent | None) -> None:
+        super().changeEvent(e)
+        if e and e.type() == e.Type.FontChange:
+            self._update_row_height()
+
+    def append(self, text: str, level: str | None = None) -> None:
+        self.live_model.append(text, level)
+
+    def append_records(self, records: Iterable[tuple[str | None, str]]) -> None:
+        self.live_model.append_records(records)
+
+    def set_filter(self, levels: Iterable[str | None] | None = None,
+                   pattern: str | None = None) -> None:
+        self.log_model.set_filter(levels, pattern)
+
+    def clear(self) -> None:
+        self.log_model.clear()
+
+    def _remember_bottom(self) -> None:
+        bar: QtWidgets.QScrollBar = self.verticalScrollBar()  # type: ignore
+        self._at_bottom = bar.value() >= bar.maximum()
+
+    def _follow(self) -> None:
+        if self._at_bottom:
+            self.scrollToBottom()
+
+    def selected_rows(self) -> list[int]:
+        return sorted(index.row() for index in
+                      self.selectionModel().selectedRows())  # type: ignore
+
+    def selected_text(self) -> str:
+        model: LogModel = self.log_model
+        return '\n'.join(model.text(model.record_index(row))
+                         for row in self.selected_rows())
+
+    def export(self, path: str | Path, selection_only: bool = False) -> int:
+        """Save the selected rows or every shown row (the filter result)."""
+        return self.log_model.export(
+            path, self.selected_rows() if selection_only else None)
+
+    def show_context_menu(self, point):
+        menu = QtWidgets.QMenu(self)
+        has_selection: bool = self.selectionModel().hasSelection()  # type: ignore
+        copy = menu.addAction('Copy')
+        copy.setObjectName('copy')  # type: ignore
+        copy.setEnabled(has_selection)  # type: ignore
+        menu.addAction('Export...').setObjectName('export')  # type: ignore
+        menu.addAction('Clear all').setObjectName('clear')  # type: ignore
+        ret = menu.exec(self.mapToGlobal(point))
+        if ret:
+            obj = ret.objectName()
+            if obj == 'clear':
+                self.clear()
+            elif obj == 'copy':
+                QtWidgets.QApplication.clipboard().setText(self.selected_text())  # type: ignore
+            elif obj == 'export':
+                path, _ = QtWidgets.QFileDialog.getSaveFileName(
+                    self, 'Export log', '', 'Log files (*.log *.txt);;All files (*)')
+                if path:
+                    self.export(path, has_selection)
+
+
+if __name__ == '__main__':
+    import sys
+    app = QtWidgets.QApplication([])
+    window = QtWidgets.QWidget()
+    layout = QtWidgets.QVBoxLayout(window)
+    search = QtWidgets.QLineEdit()
+    search.setPlaceholderText('regex filter')
+    view = LogView()
+    search.textChanged.connect(lambda text: view.set_filter(pattern=text or None))
+    layout.addWidget(search)
+    layout.addWidget(view)
+    if len(sys.argv) > 1:
+        view.open_file(sys.argv[1])
+    else:
+        names = ['TRACE', 'DEBUG', 'INFO', 'SUCCESS', 'WARNING', 'ERROR']
+        view.append_records((names[i % 6], f'{i:>9} message from device {i % 17}')
+                            for i in range(1_000_000))
+    window.resize(800, 600)
+    window.show()
+    app.exec()
@@ -1,17 +1,31 @@
 import asyncio
-from functools import partial
+import heapq
+import inspect
+import itertools
+import time
+from functools import lru_cache, partial
 from pathlib import Path
 from typing_extensions import override
 import weakref
-from PyQt6.uic.load_ui import loadUi
-from PyQt6.QtGui import QPaintEvent, QPainter, QIcon, QPalette, QPixmap, QColor
+from PyQt6 import sip
+from PyQt6.QtGui import (QPaintEvent, QPainter, QIcon, QPalette, QPixmap, QColor,
+                         QFont)
 from PyQt6.QtCore import (Qt, QPoint, QSize, QEvent, QTimer,
                           QPropertyAnimation, QParallelAnimationGroup,
                           QEasingCurve, QObject, pyqtSignal)
 from PyQt6.QtWidgets import (QStyleOption, QWidget, QStyle, QLabel, QPushButton,
-                            QGraphicsDropShadowEffect, QScrollArea,
+                            QScrollArea, QFrame, QHBoxLayout, QSizePolicy,
                             QGraphicsOpacityEffect, QApplication, QVBoxLayout)
 from qasync import QEventLoop
+from qcustomwidgets.style.shadows import update_shadow
+
+
+ASSETS = Path(__file__).parents[1] / 'assets'
+STANDARD_ICONS: dict[str, QStyle.StandardPixmap] = {
+    'info': QStyle.StandardPixmap.SP_MessageBoxInformation,
+    'warning': QStyle.StandardPixmap.SP_MessageBoxWarning,
+    'error': QStyle.StandardPixmap.SP_MessageBoxCritical,
+}
 
 
 class BaseModal(QWidget):
@@ -26,74 +40,167 @@ class BaseModal(QWidget):
     modalIcon: QPixmap | None = None
     isClosable = True
     animationDuration = 1500
+    windowTitleText: str = ''
+    iconName: str = ''
+    # (background, text) colors, None keeps the parent's
+    lightTheme: tuple[str | None, str | None] = (None, None)
+    darkTheme: tuple[str | None, str | None] = (None, None)
+    cornerRadius: int = 10
+    iconLabelSize: int = 20
+    _themes: dict[tuple[type, bool], tuple[QColor | None, QPalette | None]] = {}
+    _themesPaletteKey: int | None = None
+    _pixmaps: dict[str, QPixmap] = {}
+    _closeIcon: QIcon | None = None
 
     margin = 24
     spacing = 16
+    shadowRadius = 1
+    shadowOffset = (10, 10)
+    shadowColor = QColor(0, 0, 0, 50)
 
     closedSignal = pyqtSignal()
 
-    commonStyle = ("""
-            * {
-                border-radius: 10px;
-                border-width: 0px;
-            }
-            QPushButton#closeButton{
-                font-weight: 1000;
-                min-width: 20px;
-                min-height: 20px;
-                max-width: 20px;
-                max-height: 20px;
-            }
-            QLabel#iconlabel{
-                min-width: 20px;
-                min-height: 20px;
-                max-width: 20px;
-                max-height: 20px;
-            }
-        """)
-
     def __init__(self, position: str = '', title: str | None = None,
                  description: str | None = None, **kwargs):
         super().__init__()
-        loadUi(Path(__file__).parent.joinpath('info.ui'), self)
-        style = self.style()
-        if not style:
-            raise RuntimeError('No style')
-        # get default icon:
-        icon_path: Path = Path(__file__).parents[1].joinpath('assets')
-        self.closeIcon: QIcon = QIcon(str(icon_path.joinpath('close_mini.svg')))# style.standardIcon(QStyle.StandardPixmap.SP_TitleBarCloseButton)
-        self.closeButton.setIcon(self.closeIcon)
+        self._setupUi()
+        self._themeKey: tuple[type, bool] | None = None
+        self._background: QColor | None = None
 
-        # Get the info icon from the style
-        self.infoIcon: QPixmap = style.standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation).pixmap(QSize(32, 32))
-        # Get the success icon from the style
-        success_icon = QPixmap(str(icon_path.joinpath('cloud-done.svg')))
-        self.successIcon: QPixmap = success_icon  # style.standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton).pixmap(QSize(32, 32))
-        # Get the warning icon from the style
-        self.warningIcon: QPixmap = style.standardIcon(QStyle.StandardPixmap.SP_MessageBoxWarning).pixmap(QSize(32, 32))
-        # Get the error icon from the style
-        self.errorIcon: QPixmap = style.standardIcon(QStyle.StandardPixmap.SP_MessageBoxCritical).pixmap(QSize(32, 32))
+        self.closeButton.setFixedSize(20, 20)
+        self.closeButton.setFlat(True)
+        self.closeButton.setIconSize(QSize(self.spacing, self.spacing))
+        self.closeButton.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.closeButton.clicked.connect(self.close)
+
+        # the opacity effect only exists while fading, see fadeOut
+        self.opacityEffect: QGraphicsOpacityEffect | None = None
+        self.opacityAni = QPropertyAnimation(self)
+        self.opacityAni.setPropertyName(b'opacity')
+        self.opacityAni.finished.connect(self.close)
+        self.configure(position, title, description, **kwargs)
+
+    def _setupUi(self) -> None:
+        """Widgets of the former info.ui, built without parsing it."""
+        self.verticalLayout = QVBoxLayout(self)
+        self.verticalLayout.setContentsMargins(10, 10, 10, 10)
+        self.verticalLayout.setSpacing(10)
+        self.frame = QFrame(self)
+        self.frame.setFrameShape(QFrame.Shape.NoFrame)
+        self.horizontalLayout = QHBoxLayout(self.frame)
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout.setSpacing(10)
+        self.iconlabel = QLabel(self.frame)
+        self.iconlabel.setFixedSize(self.iconLabelSize, self.iconLabelSize)
+        self.iconlabel.setScaledContents(True)
+        self.horizontalLayout.addWidget(self.iconlabel, 0,
+                                        Qt.AlignmentFlag.AlignLeft)
+        self.titlelabel = QLabel(self.frame)
+        self.titlelabel.setSizePolicy(QSizePolicy.Policy.Expanding,
+                                      QSizePolicy.Policy.Preferred)
+        self.titlelabel.setFont(QFont('Consolas', 14))
+        self.titlelabel.setWordWrap(True)
+        self.horizontalLayout.addWidget(self.titlelabel)
+        self.closeButton = QPushButton(self.frame)
+        self.closeButton.setObjectName('closeButton')
+        self.horizontalLayout.addWidget(
+            self.closeButton, 0,
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop)
+        self.verticalLayout.addWidget(self.frame, 0, Qt.AlignmentFlag.AlignTop)
+        self.frame_2 = QFrame(self)
+        self.frame_2.setSizePolicy(QSizePolicy.Policy.Preferred,
+                                   QSizePolicy.Policy.Expanding)
+        self.frame_2.setFrameShape(QFrame.Shape.NoFrame)
+        self.verticalLayout_2 = QVBoxLayout(self.frame_2)
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_2.setSpacing(0)
+        self.bodyLabel = QLabel(self.frame_2)
+        self.bodyLabel.setFont(QFont('Consolas', 12, QFont.Weight.Bold))
+        self.bodyLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.verticalLayout_2.addWidget(self.bodyLabel)
+        self.verticalLayout.addWidget(self.frame_2)
+
+    @classmethod
+    def sharedPixmap(cls, name: str) -> QPixmap:
+        """Icons shared by all modals, created on first use."""
+        pixmap: QPixmap | None = BaseModal._pixmaps.get(name)
+        if pixmap is None:
+            if name in STANDARD_ICONS:
+                style: QStyle = QApplication.style()  # type: ignore
+                pixmap = style.standardIcon(STANDARD_ICONS[name]).pixmap(QSize(32, 32))
+            else:
+                pixmap = QPixmap(str(ASSETS / 'svg' / f'{name}.svg'))
+            BaseModal._pixmaps[name] = pixmap
+        return pixmap
+
+    @property
+    def infoIcon(self) -> QPixmap:
+        return self.sharedPixmap('info')
+
+    @property
+    def successIcon(self) -> QPixmap:
+        return self.sharedPixmap('cloud-done')
+
+    @property
+    def warningIcon(self) -> QPixmap:
+        return self.sharedPixmap('warning')
+
+    @property
+    def errorIcon(self) -> QPixmap:
+        return self.sharedPixmap('error')
+
+    def configure(self, position: str = '', title: str | None = None,
+                  description: str | None = None, **kwargs) -> None:
+        """(Re)initialize the modal, also used to recycle closed modals."""
+        if BaseModal._closeIcon is None:
+            BaseModal._closeIcon = QIcon(str(ASSETS / 'svg' / 'close_mini.svg'))
+        self.closeIcon: QIcon = BaseModal._closeIcon
+        self.modalIcon = type(self).modalIcon
+        self.isClosable = type(self).isClosable
+        self.animationDuration = type(self).animationDuration
+        self._stopFade()
+        expiry_scheduler().cancel(self)
 
         # Customize modal based on kwargs
+        self.title = title
+        self.description = description
         self.titlelabel.setText(title or '')
+        self.titlelabel.show()
         self.bodyLabel.setText(description or '')
 
         if 'closeIcon' in kwargs:
             # Set icon
             self.closeIcon = QIcon(kwargs['closeIcon'])
-            self.closeButton.setIcon(self.closeIcon)
+        self.closeButton.setIcon(self.closeIcon)
 
         if 'modalIcon' in kwargs:
             # Set modal icon
             self.modalIcon = QPixmap(kwargs['modalIcon'])
-            self.iconlabel.setPixmap(self.modalIcon)
 
         if "isClosable"  in kwargs:
             self.isClosable = kwargs['isClosable']
 
-        if 'parent' in kwargs:
+        if 'parent' in kwargs and kwargs['parent'] is not super().parent():
             self.setParent(kwargs['parent'])
-        parent: QWidget | None = self.parent()  # type: ignore
+        self.position = position
+        if 'animationDuration' in kwargs:
+            self.animationDuration = kwargs['animationDuration']
+        if 'duration' in kwargs:
+            self.animationDuration = kwargs['duration']
+
+        self.closeButton.setVisible(self.isClosable)
+        self.setWindowTitle(self.windowTitleText)
+        pixmap: QPixmap | None = self.modalIcon
+        if pixmap is None and self.iconName:
+            pixmap = self.sharedPixmap(self.iconName)
+        if pixmap is not None:
+            self.iconlabel.setPixmap(pixmap)
+        else:
+            self.iconlabel.clear()
+        self.applyTheme()
+
+    def _detectDark(self) -> bool:
+        parent: QWidget | None = super().parent()  # type: ignore
         if parent is not None:
             palette = parent.palette()
         else:
@@ -112,53 +219,63 @@ class BaseModal(QWidget):
         luminance += 0.7152 * background_color.green()
         luminance += 0.0722 * background_color.blue()
 
-        shadow_effect = QGraphicsDropShadowEffect(self)
-        # shadow_effect.setBlurRadius(100)
-        shadow_effect.setColor(QColor(0, 0, 0, 50))
-        shadow_effect.setOffset(10, 10)
-        self.setGraphicsEffect(shadow_effect)
-
         # Determine if the background color is dark or light
-        if luminance < 128:
-            # Dark background
-            self.isDark = True
-        else:
-            # Light background
-            self.isDark = False
-
-        self.position = position
-        if 'animationDuration' in kwargs:
-            self.animationDuration = kwargs['animationDuration']
-        if 'duration' in kwargs:
-            self.animationDuration = kwargs['duration']
-
-        self.closeButton.setFixedSize(20, 20)
-        self.closeButton.setIconSize(QSize(self.spacing, self.spacing))
-        self.closeButton.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.closeButton.clicked.connect(self.close)
-        self.closeButton.setVisible(self.isClosable)
+        return luminance < 128
 
-        self.opacityEffect = QGraphicsOpacityEffect(self)
-        self.opacityAni = QPropertyAnimation(
-            self.opacityEffect, b'opacity', self)  # type: ignore
+    @classmethod
+    def theme(cls, isDark: bool) -> tuple[QColor | None, QPalette | None]:
+        """Background color and text palette shared by all modals of this
+        type; rebuilt when the application palette changes."""
+        paletteKey: int = QApplication.palette().cacheKey()
+        if BaseModal._themesPaletteKey != paletteKey:
+            BaseModal._themes.clear()
+            BaseModal._themesPaletteKey = paletteKey
+        key: tuple[type, bool] = (cls, isDark)
+        if key not in BaseModal._themes:
+            background, text = cls.darkTheme if isDark else cls.lightTheme
+            palette: QPalette | None = None
+            if text is not None:
+                palette = QPalette(QApplication.palette())
+                for role in (QPalette.ColorRole.WindowText,
+                             QPalette.ColorRole.Text,
+                             QPalette.ColorRole.ButtonText):
+                    palette.setColor(role, QColor(text))
+            BaseModal._themes[key] = (QColor(background) if background else None,
+                                      palette)
+        return BaseModal._themes[key]
+
+    def applyTheme(self) -> None:
+        self.isDark = self._detectDark()
+        background, palette = self.theme(self.isDark)
+        key: tuple[type, bool] = (type(self), self.isDark)
+        if key == self._themeKey and self._background == background:
+            return
+        self._themeKey = key
+        self._background = background
+        self.setPalette(palette if palette is not None else QPalette())
+        self.update()
 
-        # Set attribute to enable styled background
-        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+    @override
+    def changeEvent(self, a0: QEvent | None) -> None:
+        super().changeEvent(a0)
+        if a0 is not None and a0.type() == QEvent.Type.PaletteChange:
+            self.applyTheme()
 
     @override
     def paintEvent(self, a0: QPaintEvent | None):
-        super().paintEvent(a0)
-
-        opt = QStyleOption()
-        opt.initFrom(self)
         painter = QPainter(self)
-        self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget,  # type: ignore
-                                    opt, painter, self)
+        if self._background is None:
+            # no theme colors (CustomModal): leave it to the style sheet
+            opt = QStyleOption()
+            opt.initFrom(self)
+            self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget,  # type: ignore
+                                       opt, painter, self)
+            return
         painter.setRenderHints(QPainter.RenderHint.Antialiasing)
         painter.setPen(Qt.PenStyle.NoPen)
-        #
-        rect = self.rect().adjusted(1, 1, -1, -1)
-        painter.drawRoundedRect(rect, 6, 6)
+        painter.setBrush(self._background)
+        painter.drawRoundedRect(self.rect(), self.cornerRadius,
+                                self.cornerRadius)
 
     def adjustSizeToContent(self):
         # Calculate the size hint based on the content
@@ -209,45 +326,62 @@ class BaseModal(QWidget):
             self.move(x, y)
 
 
+    def restartLifetime(self) -> None:
+        """(Re)start the auto-close countdown, cancelling a running fade."""
+        if self.opacityEffect is not None:
+            self._stopFade()
+            update_shadow(self, self.shadowRadius, 10, self.shadowColor,
+                          self.shadowOffset)
+        if self.animationDuration > 0:
+            expiry_scheduler().schedule(self, self.animationDuration)
+        else:
+            expiry_scheduler().cancel(self)
+
+    def _stopFade(self) -> None:
+        self.opacityAni.stop()
+        if self.opacityEffect is not None:
+            self.opacityAni.setTargetObject(None)
+            self.setGraphicsEffect(None)  # deletes the effect
+            self.opacityEffect = None
+
     def fadeOut(self):
         """ fade out """
         if self.animationDuration < 0:
             return
-        self.opacityAni.setDuration(self.animationDuration - 500)
+        # the shadow layer can't fade with the modal, drop the shadow instead
+        update_shadow(self, 0)
+        if self.opacityEffect is None:
+            self.opacityEffect = QGraphicsOpacityEffect(self)
+            self.setGraphicsEffect(self.opacityEffect)
+            self.opacityAni.setTargetObject(self.opacityEffect)
+        self.opacityAni.setDuration(max(0, self.animationDuration - 500))
         self.opacityAni.setStartValue(1)
         self.opacityAni.setEndValue(0)
-        self.opacityAni.finished.connect(self.close)
         self.opacityAni.start()
 
-    @override
-    def eventFilter(self, a0, a1: QEvent | None) -> bool:
-        if a0 is self.parent() and a1:
-            if a1.type() in [QEvent.Type.Resize,
-                            QEvent.Type.WindowStateChange]:
-                self.adjustSizeToContent()
-
-        return super().eventFilter(a0, a1)
-
     @override
     def closeEvent(self, a0) -> None:
+        update_shadow(self, 0)
+        expiry_scheduler().cancel(self)
+        self._stopFade()
         self.closedSignal.emit()
-        self.deleteLater()
+        pool: ModalPool | None = getattr(self, '_pool', None)
+        if pool is None or not pool.release(self):
+            self.deleteLater()
 
     @override
     def showEvent(self, a0) -> None:
         super().showEvent(a0)
 
         self.adjustSizeToContent()
+        update_shadow(self, self.shadowRadius, 10, self.shadowColor,
+                      self.shadowOffset)
 
-        if self.animationDuration > 0:
-            QTimer.singleShot(self.animationDuration, self.fadeOut)
+        self.restartLifetime()
 
         if self.position is not None:
-            manager = ModalsManager.make(self.position)
+            manager = ModalsManager.make(self.position, self.parent())
             manager.add(self)
-        parent = self.parent()
-        if parent:
-            parent.installEventFilter(self)
 
     def parent(self):
         p = super().parent()
@@ -290,171 +424,174 @@ class BaseModal(QWidget):
 
 
 class InformationModal(BaseModal):
+    windowTitleText = 'Information'
+    iconName = 'info'
+    lightTheme = ('#E6F7FF', '#333333')
+    darkTheme = ('#2799be', '#F5F5F5')
+
     def __init__(self, position: str = 'top-center',
                  title: str | None = 'Info',
                  description: str | None = None, **kwargs):
         super().__init__(position, title, description, **kwargs)
-        self.setWindowTitle("Information")
-        if self.modalIcon:
-            self.iconlabel.setPixmap(self.modalIcon)
-        else:
-            self.iconlabel.setPixmap(self.infoIcon)
-
-        lightStyle = """
-            /* Information Modal */
-            InformationModal {
-                background-color: #E6F7FF; /* Light blue or teal */
-            }
-            InformationModal * {
-                color: #333333;
-                background-color: transparent;
-            }
-        """
-
-        darkStyle = """
-            InformationModal {
-                background-color: #2799be; /* Light blue or teal for improved contrast */
-            }
-            InformationModal * {
-                color: #F5F5F5; /* Whitish color */
-                background-color: transparent;
-            }
-        """
-
-        if self.isDark:
-            self.setStyleSheet(darkStyle + self.commonStyle)
-        else:
-            self.setStyleSheet(lightStyle + self.commonStyle)
 
 
 class SuccessModal(BaseModal):
+    windowTitleText = 'Success'
+    iconName = 'cloud-done'
+    lightTheme = ('#81c785', '#FFFFFF')
+    darkTheme = ('#81c785', '#FFFFFF')
+
     def __init__(self, position: str = 'top-center',
                  title: str | None = 'Success',
                  description: str | None = None, **kwargs):
         super().__init__(position, title, description, **kwargs)
-        self.setWindowTitle("Success")
-        if self.modalIcon:
-            self.iconlabel.setPixmap(self.modalIcon)
-        else:
-            self.iconlabel.setPixmap(self.successIcon)
-
-        lightStyle = """
-            /* Success Modal */
-            SuccessModal {
-                background-color: #81c785; /* Light green */
-            }
-            SuccessModal * {
-                color: #FFFFFF; /* Dark green or gray */
-                background-color: transparent;
-            }
-        """
-        darkStyle = """
-            /* Success Modal */
-            SuccessModal {
-                background-color: #81c785; /* Dark green for improved contrast */
-            }
-            SuccessModal * {
-                color: #FFFFFF; /* Whitish color */
-                background-color: transparent;
-            }
-        """
-        if self.isDark:
-            self.setStyleSheet(darkStyle + self.commonStyle)
-        else:
-            self.setStyleSheet(lightStyle + self.commonStyle)
 
 
 class WarningModal(BaseModal):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.setWindowTitle("Warning")
-        if self.modalIcon:
-            self.iconlabel.setPixmap(self.modalIcon)
-        else:
-            self.iconlabel.setPixmap(self.warningIcon)
-
-        lightStyle = """
-            /* Warning Modal */
-            WarningModal {
-                background-color: #FFF9E1; /* Light yellow */
-            }
-            WarningModal * {
-                color: #333333; /* Dark yellow or gray */
-                background-color: transparent;
-            }
-        """
-        darkStyle = """
-            /* Warning Modal */
-            WarningModal {
-                background-color: #bb8128; /* Light yellow for improved contrast */
-            }
-            WarningModal * {
-                color: #F5F5F5; /* Whitish color */
-                background-color: transparent;
-            }
-        """
-        if self.isDark:
-            self.setStyleSheet(darkStyle + self.commonStyle)
-        else:
-            self.setStyleSheet(lightStyle + self.commonStyle)
+    windowTitleText = 'Warning'
+    iconName = 'warning'
+    lightTheme = ('#FFF9E1', '#333333')
+    darkTheme = ('#bb8128', '#F5F5F5')
 
 
 class ErrorModal(BaseModal):
+    windowTitleText = 'Error'
+    iconName = 'error'
+    lightTheme = ('#FFEBEE', '#333333')
+    darkTheme = ('#bb221d', '#F5F5F5')
+
     def __init__(self, position: str = 'top-center',
                  title: str | None = 'Error',
                  description: str | None = None, **kwargs):
         super().__init__(position, title, description, **kwargs)
-        self.setWindowTitle("Error")
-        if self.modalIcon:
-            self.iconlabel.setPixmap(self.modalIcon)
-        else:
-            self.iconlabel.setPixmap(self.errorIcon)
-
-        lightStyle = """
-            /* Error Modal */
-            ErrorModal {
-                background-color: #FFEBEE; /* Light red or pink */
-            }
-            ErrorModal * {
-                color: #333333; /* Dark red or gray */
-                background-color: transparent;
-            }
-        """
-        darkStyle = """
-            /* Error Modal */
-            ErrorModal {
-                background-color: #bb221d; /* Light red or pink for improved contrast */
-            }
-            ErrorModal * {
-                color: #F5F5F5; /* Whitish color */
-                background-color: transparent;
-            }
-        """
-        if self.isDark:
-            self.setStyleSheet(darkStyle + self.commonStyle)
-        else:
-            self.setStyleSheet(lightStyle + self.commonStyle)
 
 
 class CustomModal(BaseModal):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.setWindowTitle("Custom")
-        if self.modalIcon:
-            self.iconlabel.setPixmap(QPixmap(self.modalIcon))
-
-        style = """
-            CustomModal * {
-                background-color: transparent;
-            }
-        """
+    """Transparent by default, needs additional styling."""
+    windowTitleText = 'Custom'
+    iconLabelSize = 30
+
+
+class _ExpiryScheduler(QObject):
+    """
+    Auto-close deadlines of all modals, kept in a heap and served by one
+    timer armed for the earliest deadline. Rescheduled or cancelled
+    entries are skipped lazily when they reach the top of the heap.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self._heap: list[tuple[float, int, BaseModal]] = []
+        self._deadlines: dict[BaseModal, float] = {}
+        self._counter = itertools.count()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._expire)
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def schedule(self, modal: BaseModal, delay: int) -> None:
+        """Fade `modal` out in `delay` milliseconds."""
+        deadline: float = time.monotonic() + delay / 1000
+        self._deadlines[modal] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), modal))
+        if len(self._heap) > 2 * len(self._deadlines) + 32:
+            self._heap = [(d, n, m) for d, n, m in self._heap
+                          if self._deadlines.get(m) == d]
+            heapq.heapify(self._heap)
+        self._arm()
+
+    def cancel(self, modal: BaseModal) -> None:
+        if self._deadlines.pop(modal, None) is not None and not self._deadlines:
+            self._heap.clear()
+            self.timer.stop()
+
+    def _arm(self) -> None:
+        heap = self._heap
+        while heap and self._deadlines.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        if not heap:
+            self.timer.stop()
+            return
+        delay: float = heap[0][0] - time.monotonic()
+        self.timer.start(max(0, int(delay * 1000) + 1))
+
+    def _expire(self) -> None:
+        now: float = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            deadline, _, modal = heapq.heappop(self._heap)
+            if self._deadlines.get(modal) != deadline:
+                continue
+            del self._deadlines[modal]
+            if not sip.isdeleted(modal):
+                modal.fadeOut()
+        self._arm()
+
+
+_expiry: _ExpiryScheduler | None = None
+
+
+def expiry_scheduler() -> _ExpiryScheduler:
+    global _expiry
+    if _expiry is None:
+        _expiry = _ExpiryScheduler()
+    return _expiry
+
+
+class ModalPool:
+    """
+    Keeps closed modals of each type hidden for reuse: `acquire` calls
+    `configure` on a recycled modal instead of building a new one.
+    """
+    def __init__(self, max_size: int = 16) -> None:
+        self.max_size: int = max_size
+        self._free: dict[type, list[BaseModal]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(free) for free in self._free.values())
+
+    @staticmethod
+    @lru_cache
+    def _defaults(modal_type: type) -> dict:
+        params = inspect.signature(modal_type.__init__).parameters
+        return {name: params[name].default
+                for name in ('position', 'title', 'description')
+                if name in params
+                and params[name].default is not inspect.Parameter.empty}
+
+    def acquire(self, modal_type: type[BaseModal], **kwargs) -> BaseModal:
+        free: list[BaseModal] = self._free.get(modal_type, [])
+        while free:
+            modal: BaseModal = free.pop()
+            if not sip.isdeleted(modal):
+                modal.configure(**{**self._defaults(modal_type), **kwargs})
+                return modal
+        modal = modal_type(**kwargs)
+        modal._pool = self  # type: ignore
+        return modal
+
+    def release(self, modal: BaseModal) -> bool:
+        """Take a closed `modal` back. Connections to its `closedSignal` are
+        dropped. Returns False if the pool is full."""
+        free: list[BaseModal] = self._free.setdefault(type(modal), [])
+        if len(free) >= self.max_size or modal in free:
+            return False
+        try:
+            modal.closedSignal.disconnect()
+        except TypeError:
+            pass
+        free.append(modal)
+        return True
+
 
-        self.setStyleSheet(style)
+modal_pool = ModalPool()
 
 
 class ModalsManager(QObject):
     _instance = None
     managers = {}
+    _instances: dict[tuple[str, int], 'ModalsManager'] = {}
+    installed_filters: int = 0
 
     # def __new__(cls, *args, **kwargs):
     #     # Singleton pattern: ensures only one instance of the class is created
@@ -464,18 +601,24 @@ class ModalsManager(QObject):
 
     #     return cls._instance
 
-    def __init__(self):
+    def __init__(self, parent: QObject | None = None):
         # Initialize the class attributes and instance variables
         # if self.__initialized:
         #     return
 
-        super().__init__()
+        super().__init__(parent)
         self.spacing = 16
         self.margin = 24
         self.modals_store = weakref.WeakKeyDictionary()
         self.aniGroups = weakref.WeakKeyDictionary()       # Dictionary to hold animation groups
         self.slideAnis = []  # List to hold slide animations
         self.dropAnis = []   # List to hold drop animations
+        self._offsets: dict[QWidget, dict[BaseModal, int]] = {}
+        self._dirty: list[QWidget] = []
+        self._layoutTimer = QTimer(self)
+        self._layoutTimer.setSingleShot(True)
+        self._layoutTimer.setInterval(16)
+        self._layoutTimer.timeout.connect(self.relayout)
         self.__initialized = True
 
     def add(self, modal: BaseModal):
@@ -487,6 +630,7 @@ class ModalsManager(QObject):
         # Initialize dictionaries if the parent widget is not already in them
         if p not in self.modals_store:
             p.installEventFilter(self)  # Install event filter on parent widget
+            ModalsManager.installed_filters += 1
             self.modals_store[p] = [] # List to hold modal instances for this parent
             self.aniGroups[p] = QParallelAnimationGroup(self) # Animation group for this parent
 
@@ -531,11 +675,13 @@ class ModalsManager(QObject):
         if dropAni:
             self.aniGroups[p].removeAnimation(dropAni)  # Remove the drop animation from the animation group
             self.dropAnis.remove(dropAni)              # Remove the drop animation from the list
+            modal.setProperty('dropAni', None)
 
         # Remove slide animation
         slideAni: QPropertyAnimation = modal.property('slideAni') # Get the slide animation property
         if slideAni:
             self.slideAnis.remove(slideAni)  # Remove the slide animation from the list
+            modal.setProperty('slideAni', None)
 
         # Adjust the position of the remaining info bars
         self.updateDropAni(p)
@@ -637,15 +783,45 @@ class ModalsManager(QObject):
             return False
 
         if a1 and a1.type() in [QEvent.Type.Resize, QEvent.Type.WindowStateChange]:
-            if a1.type() == QEvent.Type.Resize:
-                size = a1.size()  # type: ignore
-            else:
-                size = None
-            for bar in self.modals_store[a0]:
-                bar.move(self.modalPosition(bar, size))
+            # coalesced into one layout pass per frame
+            if a0 not in self._dirty:
+                self._dirty.append(a0)
+            if not self._layoutTimer.isActive():
+                self._layoutTimer.start()
 
         return super().eventFilter(a0, a1)
 
+    def relayout(self) -> None:
+        """Move the modals of every resized parent in one sweep."""
+        dirty, self._dirty = self._dirty, []
+        for p in dirty:
+            if sip.isdeleted(p) or p not in self.modals_store:
+                continue
+            offsets: dict[BaseModal, int] = {}
+            offset: int = 0
+            for bar in self.modals_store[p]:
+                offsets[bar] = offset
+                offset += bar.height() + self.spacing
+            self._offsets[p] = offsets
+            try:
+                for bar in self.modals_store[p]:
+                    bar.move(self.modalPosition(bar))
+            finally:
+                del self._offsets[p]
+
+    def stackOffset(self, modal: BaseModal) -> int:
+        """Heights and spacings of the modals stacked before `modal`."""
+        p = modal.parent()
+        offsets: dict[BaseModal, int] | None = self._offsets.get(p)
+        if offsets is not None:
+            return offsets[modal]
+        offset: int = 0
+        for bar in self.modals_store[p]:
+            if bar is modal:
+                break
+            offset += bar.height() + self.spacing
+        return offset
+
     @classmethod
     def register(cls, name: str):
         """Register menu animation manager"""
@@ -658,12 +834,22 @@ class ModalsManager(QObject):
         return wrapper
 
     @classmethod
-    def make(cls, position: str):
-        """Create info bar manager according to the display position"""
+    def make(cls, position: str, parent: QWidget | None = None):
+        """
+        Return the info bar manager of `parent` for the display position.
+        Managers are created once per (position, parent) and are children of
+        `parent`, so modals shown at the same place share stacking state,
+        animation groups and the parent's event filter.
+        """
         if position not in cls.managers:
             raise ValueError(f'`{position}` is an invalid animation type.')
-
-        return cls.managers[position]()
+        key: tuple[str, int] = (position, id(parent))
+        manager: ModalsManager | None = cls._instances.get(key)
+        if manager is None or sip.isdeleted(manager):
+            manager = cls.managers[position](parent)
+            manager.destroyed.connect(lambda *_: cls._instances.pop(key, None))
+            cls._instances[key] = manager
+        return manager  # type: ignore
 
 @ModalsManager.register("center-center")
 class CenterCenterQCustomModalsManager(ModalsManager):
@@ -699,9 +885,7 @@ class TopModalsManager(ModalsManager):
 
         x = (p.width() - modal.width()) // 2
         y = self.margin
-        index = self.modals_store[p].index(modal)
-        for bar in self.modals_store[p][0:index]:
-            y += (bar.height() + self.spacing)
+        y += self.stackOffset(modal)
 
         return QPoint(x, y)
 
@@ -724,9 +908,7 @@ class TopRightModalsManager(ModalsManager):
 
         x: int = pSize.width() - modal.width() - self.margin
         y: int = self.margin
-        index = self.modals_store[p].index(modal)
-        for bar in self.modals_store[p][0:index]:
-            y += (bar.height() + self.spacing)
+        y += self.stackOffset(modal)
 
         return QPoint(x, y)
 
@@ -751,9 +933,7 @@ class BottomRightQCustomModalsManager(ModalsManager):
         x: int = pSize.width() - modal.width() - self.margin
         y: int = pSize.height() - modal.height() - self.margin
 
-        index = self.modals_store[p].index(modal)
-        for bar in self.modals_store[p][0:index]:
-            y -= (bar.height() + self.spacing)
+        y -= self.stackOffset(modal)
 
         return QPoint(x, y)
 
@@ -772,10 +952,7 @@ class TopLeftQCustomModalsManager(ModalsManager):
         p: QWidget = modal.parent()  # type: ignore
 
         y: int = self.margin
-        index: int = self.modals_store[p].index(modal)
-
-        for bar in self.modals_store[p][0:index]:
-            y += (bar.height() + self.spacing)
+        y += self.stackOffset(modal)
 
         return QPoint(self.margin, y)
 
@@ -798,10 +975,7 @@ class BottomLeftQCustomModalsManager(ModalsManager):
             pSize = p.size()
 
         y: int = pSize.height() - modal.height() - self.margin
-        index: int = self.modals_store[p].index(modal)
-
-        for bar in self.modals_store[p][0:index]:
-            y -= (bar.height() + self.spacing)
+        y -= self.stackOffset(modal)
 
         return QPoint(self.margin, y)
 
@@ -824,10 +998,7 @@ class BottomQCustomModalsManager(ModalsManager):
 
         x: int = (pSize.width() - modal.width()) // 2
         y: int = pSize.height() - modal.height() - self.margin
-        index: int = self.modals_store[p].index(modal)
-
-        for bar in self.modals_store[p][0:index]:
-            y -= (bar.height() + self.spacing)
+        y -= self.stackOffset(modal)
 
         return QPoint(x, y)
 
@@ -952,13 +1123,13 @@ class TestModalWindow(QWidget):
         }
         modal = QWidget()
         if modal_type == "Information":
-            modal = InformationModal(**kwargs)
+            modal = modal_pool.acquire(InformationModal, **kwargs)
         elif modal_type == "Success":
-            modal = SuccessModal(**kwargs)
+            modal = modal_pool.acquire(SuccessModal, **kwargs)
         elif modal_type == "Warning":
-            modal = WarningModal(**kwargs)
+            modal = modal_pool.acquire(WarningModal, **kwargs)
         elif modal_type == "Error":
-            modal = ErrorModal(**kwargs)
+            modal = modal_pool.acquire(ErrorModal, **kwargs)
         elif modal_type == "Custom":
             style = self.style()
             if style:
@@ -967,7 +1138,7 @@ class TestModalWindow(QWidget):
                 kwargs["description"] += "\n\nCustom modals need additional "\
                                          "styling since they are transparent "\
                                          "by default."
-                modal = CustomModal(**kwargs)
+                modal = modal_pool.acquire(CustomModal, **kwargs)
         modal.show()
 
     def isDark(self):
@@ -0,0 +1,340 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Callable, Generator, Literal
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtWidgets import QApplication, QWidget
+from qcustomwidgets.widgets.modals import (BaseModal, InformationModal,
+                                           SuccessModal, WarningModal,
+                                           ErrorModal, ModalPool, modal_pool)
+
+
+GROUP = tuple[int, str]
+MESSAGE = tuple[type, str, str, str, int]
+KINDS: dict[str, type[BaseModal]] = {
+    'info': InformationModal,
+    'success': SuccessModal,
+    'warning': WarningModal,
+    'error': ErrorModal,
+}
+
+
+class NotificationQueue(QObject):
+    """
+    Throttles toasts shown through the modals subsystem. Per parent and
+    position at most `max_visible` toasts are shown, identical messages are
+    collapsed into one toast with a counter, bursts are limited by a token
+    bucket (`rate` toasts per second, up to `burst` at once) and everything
+    beyond `max_pending` queued messages is folded into a summary toast.
+    When a parent is destroyed its toasts and queued messages are dropped
+    and their `on_closed` callbacks are called.
+    """
+    def __init__(self, max_visible: int = 3, rate: float = 4.0,
+                 burst: int = 8, max_pending: int = 20,
+                 pool: ModalPool = modal_pool,
+                 parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.max_visible: int = max_visible
+        self.rate: float = rate
+        self.burst: int = burst
+        self.max_pending: int = max_pending
+        self.pool: ModalPool = pool
+        self._tokens: float = burst
+        self._refilled: float = time.monotonic()
+        self._visible: dict[GROUP, list[BaseModal]] = {}
+        self._shown: dict[MESSAGE, BaseModal] = {}
+        self._counts: dict[BaseModal, int] = {}
+        self._callbacks: dict[BaseModal, list[Callable[[], None]]] = {}
+        self._overflowCallbacks: dict[GROUP, list[Callable[[], None]]] = {}
+        self._pending: dict[GROUP, OrderedDict[MESSAGE, list]] = {}
+        self._overflow: dict[GROUP, int] = {}
+        self._summaries: dict[GROUP, BaseModal] = {}
+        self._parents: dict[GROUP, QWidget] = {}
+        self._watched: set[int] = set()
+        self._drainTimer = QTimer(self)
+        self._drainTimer.setSingleShot(True)
+        self._drainTimer.timeout.connect(self.drain)
+
+    def push(self, modal_type: type[BaseModal], title: str | None = None,
+             description: str | None = None, position: str = 'top-right',
+             parent: QWidget | None = None,
+             on_closed: Callable[[], None] | None = None,
+             **kwargs) -> BaseModal | None:
+        """Show a toast or queue it. Returns the toast if it is visible.
+        `on_closed` is called when the toast carrying the message (or the
+        summary it was folded into) is closed."""
+        if parent is None:
+            raise ValueError('Notification without parent')
+        group: GROUP = (id(parent), position)
+        key: MESSAGE = (modal_type, title or '', description or '', position,
+                        id(parent))
+        self._parents[group] = parent
+        if id(parent) not in self._watched:
+            self._watched.add(id(parent))
+            parent.destroyed.connect(
+                lambda _=None, parent_id=id(parent): self._dropped(parent_id))
+        callbacks: list[Callable[[], None]] = [on_closed] if on_closed else []
+        modal: BaseModal | None = self._shown.get(key)
+        if modal is not None:
+            self._bump(modal, self._counts[modal] + 1)
+            self._callbacks[modal] += callbacks
+            return modal
+        pending = self._pending.setdefault(group, OrderedDict())
+        if key in pending:
+            pending[key][1] += 1
+            pending[key][2] += callbacks
+        elif len(pending) >= self.max_pending:
+            self._overflow[group] = self._overflow.get(group, 0) + 1
+            self._overflowCallbacks.setdefault(group, []).extend(callbacks)
+        else:
+            pending[key] = [dict(kwargs, title=title, description=description,
+                                 position=position, parent=parent), 1,
+                            callbacks]
+        self.drain()
+        return self._shown.get(key)
+
+    def pending(self) -> int:
+        return sum(len(p) for p in self._pending.values()) \
+            + sum(self._overflow.values())
+
+    def _take_token(self) -> bool:
+        now: float = time.monotonic()
+        self._tokens = min(self.burst,
+                           self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def drain(self) -> None:
+        for group, pending in self._pending.items():
+            visible: list[BaseModal] = self._visible.setdefault(group, [])
+            while pending and len(visible) < self.max_visible:
+                if not self._take_token():
+                    self._drainTimer.start(int(1000 / self.rate) + 1)
+                    return
+                key, (kwargs, count, callbacks) = pending.popitem(last=False)
+                self._show(group, key, kwargs, count, callbacks)
+            if not pending and self._overflow.get(group):
+                self._summarize(group)
+
+    def _show(self, group: GROUP, key: MESSAGE | None, kwargs: dict,
+              count: int, callbacks: list[Callable[[], None]]) -> BaseModal:
+        modal_type: type[BaseModal] = key[0] if key else InformationModal
+        modal: BaseModal = self.pool.acquire(modal_type, **kwargs)
+        self._visible[group].append(modal)
+        if key is not None:
+            self._shown[key] = modal
+        self._counts[modal] = 1
+        self._callbacks[modal] = callbacks
+        modal.closedSignal.connect(lambda: self._closed(group, key, modal))
+        modal.show()
+        if count > 1:
+            self._bump(modal, count)
+        return modal
+
+    def _summarize(self, group: GROUP) -> None:
+        count: int = self._overflow.pop(group)
+        callbacks = self._overflowCallbacks.pop(group, [])
+        summary: BaseModal | None = self._summaries.get(group)
+        if summary is not None:
+            count += self._counts[summary]
+        text: str = f'{count} more notifications were suppressed'
+        if summary is not None:
+            self._counts[summary] = count
+            self._callbacks[summary] += callbacks
+            summary.bodyLabel.setText(text)
+            summary.adjustSizeToContent()
+            summary.restartLifetime()
+            return
+        if len(self._visible[group]) >= self.max_visible:
+            self._overflow[group] = count
+            self._overflowCallbacks[group] = callbacks
+            return
+        summary = self._show(group, None, {
+            'title': 'Notifications', 'description': text,
+            'position': group[1], 'parent': self._parents[group]}, 1, callbacks)
+        self._counts[summary] = count
+        self._summaries[group] = summary
+
+    def _bump(self, modal: BaseModal, count: int) -> None:
+        self._counts[modal] = count
+        modal.titlelabel.setText(f'{modal.title or ""} (x{count})')
+        modal.titlelabel.show()
+        modal.adjustSizeToContent()
+        modal.restartLifetime()
+
+    def _closed(self, group: GROUP, key: MESSAGE | None,
+                modal: BaseModal) -> None:
+        if modal in self._visible.get(group, []):
+            self._visible[group].remove(modal)
+        if key is not None and self._shown.get(key) is modal:
+            del self._shown[key]
+        if self._summaries.get(group) is modal:
+            del self._summaries[group]
+        self._counts.pop(modal, None)
+        for callback in self._callbacks.pop(modal, []):
+            callback()
+        if not self._visible.get(group) and not self._pending.get(group) \
+                and not self._overflow.get(group):
+            self._visible.pop(group, None)
+            self._pending.pop(group, None)
+            self._parents.pop(group, None)
+        self.drain()
+
+    def _dropped(self, parent_id: int) -> None:
+        """Forget everything shown or queued on a destroyed parent."""
+        self._watched.discard(parent_id)
+        groups: set[GROUP] = {group for group in (*self._visible, *self._pending,
+                                                  *self._overflow, *self._parents)
+                              if group[0] == parent_id}
+        callbacks: list[Callable[[], None]] = []
+        for group in groups:
+            for modal in self._visible.pop(group, []):
+                self._counts.pop(modal, None)
+                callbacks += self._callbacks.pop(modal, [])
+            for _, _, pending_callbacks in self._pending.pop(group, {}).values():
+                callbacks += pending_callbacks
+            callbacks += self._overflowCallbacks.pop(group, [])
+            self._overflow.pop(group, None)
+            self._summaries.pop(group, None)
+            self._parents.pop(group, None)
+        for key in [key for key in self._shown if key[4] == parent_id]:
+            del self._shown[key]
+        for callback in callbacks:
+            callback()
+
+
+_queue: NotificationQueue | None = None
+
+
+def notification_queue() -> NotificationQueue:
+    """Queue shared by the whole application."""
+    global _queue
+    if _queue is None:
+        _queue = NotificationQueue()
+    return _queue
+
+
+
+class NotificationHandle:
+    """
+    Result of `notify`: resolved when the toast is closed. Can be awaited
+    in any asyncio loop or waited on with `result()` from a thread.
+    """
+    def __init__(self) -> None:
+        self.future: Future = Future()
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def result(self, timeout: float | None = None) -> bool:
+        """True once the toast was closed, False if it could not be shown
+        or its parent was destroyed first."""
+        return self.future.result(timeout)
+
+    def _resolve(self, shown: bool = True) -> None:
+        if not self.future.done():
+            self.future.set_result(shown)
+
+    def __await__(self) -> Generator:
+        return asyncio.wrap_future(self.future).__await__()
+
+
+class _Dispatcher(QObject):
+    """
+    Lives in the GUI thread and drains `notify` requests once per frame.
+    Its slots are real Qt slots, so queued calls reach the GUI thread even
+    when the dispatcher was created by a worker thread.
+    """
+    wake = pyqtSignal()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests: deque[tuple] = deque()
+        self.woken: bool = False
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(16)
+        self.timer.timeout.connect(self.dispatch)
+        self.wake.connect(self._schedule, Qt.ConnectionType.QueuedConnection)
+
+    def post(self, request: tuple) -> None:
+        self.requests.append(request)
+        if not self.woken:
+            self.woken = True
+            self.wake.emit()
+
+    @pyqtSlot()
+    def _schedule(self) -> None:
+        if not self.timer.isActive():
+            self.timer.start()
+
+    @pyqtSlot()
+    def dispatch(self) -> None:
+        self.woken = False
+        queue: NotificationQueue = notification_queue()
+        for _ in range(len(self.requests)):
+            modal_type, title, text, position, parent, handle, kwargs = \
+                self.requests.popleft()
+            if parent is None:
+                parent = QApplication.activeWindow()
+            if parent is None:
+                handle._resolve(False)
+                continue
+            queue.push(modal_type, title, text, position, parent,
+                       on_closed=lambda handle=handle, parent=parent:
+                       handle._resolve(not sip.isdeleted(parent)), **kwargs)
+
+
+_dispatcher: _Dispatcher | None = None
+_dispatcher_lock = threading.Lock()
+
+
+def notify(kind: Literal['info', 'success', 'warning', 'error'] | type[BaseModal],
+           title: str | None = None, text: str | None = None,
+           position: str = 'top-right', parent: QWidget | None = None,
+           **kwargs) -> NotificationHandle:
+    """
+    Show a toast through the application's `NotificationQueue`. Safe to
+    call from any thread or coroutine: the request is only appended to a
+    deque, the GUI thread picks it up on its next frame. Without `parent`
+    the active window is used.
+    """
+    global _dispatcher
+    app = QApplication.instance()
+    if app is None:
+        raise RuntimeError('notify() needs a QApplication')
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            dispatcher = _Dispatcher()
+            dispatcher.moveToThread(app.thread())
+            _dispatcher = dispatcher
+    handle = NotificationHandle()
+    modal_type: type[BaseModal] = KINDS[kind] if isinstance(kind, str) else kind
+    _dispatcher.post((modal_type, title, text, position, parent, handle, kwargs))
+    return handle
+
+if __name__ == '__main__':
+    from PyQt6.QtWidgets import QApplication, QPushButton, QVBoxLayout
+    from qcustomwidgets.widgets.modals import ErrorModal
+    app = QApplication([])
+    window = QWidget()
+    window.resize(800, 600)
+    layout = QVBoxLayout(window)
+    button = QPushButton('Alert storm')
+    button.clicked.connect(lambda: [
+        notification_queue().push(ErrorModal, 'Connection lost',
+                                  f'device {i % 12}', parent=window)
+        for i in range(200)])
+    layout.addWidget(button)
+    worker = QPushButton('Notify from a thread')
+    worker.clicked.connect(lambda: threading.Thread(
+        target=lambda: notify('success', 'Worker', 'finished').result()).start())
+    layout.addWidget(worker)
+    window.show()
+    app.exec()
@@ -0,0 +1,323 @@
+from pathlib import Path
+from typing import Iterable, Literal
+from typing_extensions import override
+from PyQt6.QtCore import Qt, QEvent, QRect, QSize
+from PyQt6.QtWidgets import QAbstractButton, QApplication, QWidget, QHBoxLayout
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen, QBrush
+from qcustomwidgets.style.palettes import dark, light
+from qcustomwidgets.style.shadows import update_shadow
+from qcustomwidgets.style.transitions import StyleTransition
+from qcustomwidgets.widgets.button import (ICON_SOURCE, default_style,
+                                           update_style_palette, _hex)
+from qcustomwidgets.widgets.image_box import ImageBox, cached_pixmap
+
+
+ICON_SPACING = 6
+
+
+class PaintedButton(QAbstractButton):
+    """
+    Drop-in variant of `Button` which has no child widgets, layouts or
+    graphics effects: text and icons are drawn in `paintEvent`, icons are
+    taken from the shared pixmap cache and shadows from the parent's
+    `ShadowLayer`.
+    """
+    def __init__(self, text="", icons: ICON_SOURCE | None = None,
+                 parent=None, flat: bool = False,
+                 iterate_icons: bool = False, tooltip: str | None = None,
+                 constant_color: bool = False,
+                 icon_position: Literal['left', 'right'] = 'left',
+                 full_size_image: bool = False,
+                 side_margins: int = 15) -> None:
+        super().__init__(parent)
+        self.setMinimumSize(50, 25)
+        self.setToolTip(tooltip)
+        self._margin: int = 0 if flat else side_margins
+        self._icon_constant_color: bool = constant_color
+        self._icon_position: Literal['left', 'right'] = icon_position
+        self._full_size_image: bool = full_size_image
+        self._icon_size = QSize(18, 18)
+        self._text: str = text
+        self._icons: list[str] = []
+        self._icon_colors: list[str] = []
+        self._icon_index: int = 0
+        if not self._text and flat:
+            self.setFixedSize(25, 25)
+        if icons is not None:
+            if isinstance(icons, Iterable) and not isinstance(icons, str):
+                for _icon in icons:
+                    self._add_icon(_icon)
+            else:
+                self._add_icon(icons)
+
+        self.styleDict: dict = default_style(self, flat)
+        self.transition = StyleTransition(self)
+
+        self._hover = False
+        self._press = False
+        self._is_active = False
+        self.is_flat: bool = flat
+        if iterate_icons:
+            self.clicked.connect(self.next_state)
+
+        self.changeEvent(QEvent(QEvent.Type.PaletteChange))
+
+    def _add_icon(self, icon_source: ImageBox | str | Path) -> None:
+        if isinstance(icon_source, ImageBox):
+            icon_source = icon_source.source  # type: ignore
+        self._icons.append(str(icon_source))
+        self._icon_colors.append('')
+
+    def palette_hex(self, role: str, darker: int = 0, lighter: int = 0):
+        return _hex(self, role, darker, lighter)
+
+    def icon_index(self):
+        return self._icon_index
+
+    @override
+    def changeEvent(self, e: QEvent | None):
+        super().changeEvent(e)
+        if e and e.type() == e.Type.PaletteChange:
+            update_style_palette(self.styleDict, self, self.is_flat)
+            self.transition.jump(self.styleDict[self.current_state()])
+            self.apply_shadow()
+            if self._icons and not self._icon_constant_color:
+                if self._is_active:
+                    color: str = "#FFFFFF" if self.isDark() else '#000000'
+                else:
+                    color = "#616161" if self.isDark() else "#898989"
+                self.change_icons_color(color)
+        elif e and e.type() == e.Type.ParentChange:
+            self.apply_shadow()
+
+    def set_active(self, active: bool) -> None:
+        """Mark the button as the active one of a group (e.g. the current tab)
+        and tint its icon accordingly."""
+        self._is_active = active
+        if self._icons and not self._icon_constant_color:
+            if active:
+                color: str = "#FFFFFF" if self.isDark() else '#000000'
+            else:
+                color = "#898989" if self.isDark() else '#616161'
+            self.set_current_icon_color(color)
+        self._hover = False
+        self.transition.start(self.styleDict[self.current_state()])
+        self.apply_shadow()
+
+    def isDark(self) -> bool:
+        base = self.palette().base().color().value()
+        text = self.palette().text().color().value()
+        return base < text
+
+    def set_current_icon_color(self, color: str):
+        if self._icons:
+            self._icon_colors[self._icon_index] = color
+            self.update()
+
+    def change_icons_color(self, color: str):
+        if self._icons:
+            self._icon_colors = [color] * len(self._icons)
+            self.update()
+
+    def current_icon(self) -> str | None:
+        if self._icons:
+            return self._icons[self._icon_index]
+
+    def set_state(self, state: int) -> None:
+        if self._icons and state < len(self._icons):
+            self._icon_index = state
+            self._check_state()
+
+    def next_state(self) -> None:
+        if self._icons:
+            self._icon_index = (self._icon_index + 1) % len(self._icons)
+            self._check_state()
+
+    def _check_state(self):
+        state = self.current_state()
+        if state == 'default':
+            self.leaveEvent(None)
+        elif state == 'hover':
+            self.enterEvent(None)
+        self.update()
+
+    @override
+    def setText(self, text: str | None) -> None:
+        self._text = text or ""
+        self.updateGeometry()
+        self.update()
+
+    def text(self) -> str:
+        return self._text
+
+    @override
+    def setIcon(self, icon: ImageBox | str | Path, index: int = 0) -> None:  # type: ignore
+        if isinstance(icon, ImageBox):
+            icon = icon.source  # type: ignore
+        if self._icons:
+            self._icons[index] = str(icon)
+        else:
+            self._add_icon(icon)
+        self._full_size_image = False
+        self.update()
+
+    @override
+    def setIconSize(self, width: int, height: int):  # type: ignore
+        self._icon_size = QSize(width, height)
+        self.updateGeometry()
+        self.update()
+
+    @override
+    def sizeHint(self) -> QSize:
+        fm = QFontMetrics(self._label_font())
+        width: int = self._margin * 2
+        height: int = fm.height()
+        if self._text:
+            width += fm.horizontalAdvance(self._text)
+        if self._icons:
+            width += self._icon_size.width()
+            height = max(height, self._icon_size.height())
+            if self._text:
+                width += ICON_SPACING
+        return QSize(width, height)
+
+    @override
+    def mousePressEvent(self, e) -> None:
+        self._press = True
+        self.transition.start(self.styleDict['press'])
+        self.apply_shadow()
+        return super().mousePressEvent(e)
+
+    @override
+    def mouseReleaseEvent(self, e) -> None:
+        self._press = False
+        self.transition.start(self.styleDict[self.current_state()])
+        self.apply_shadow()
+        return super().mouseReleaseEvent(e)
+
+    @override
+    def enterEvent(self, event) -> None:
+        self._hover = True
+        self.transition.start(self.styleDict[self.current_state()])
+        self.apply_shadow()
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        if self._icons and not self._is_active and not self._icon_constant_color:
+            color: str = "#FFFFFF" if self.isDark() else '#000000'
+            self.set_current_icon_color(color)
+        self.update()
+        if event is not None:
+            super().enterEvent(event)
+
+    @override
+    def leaveEvent(self, a0) -> None:
+        self._hover = False
+        self.transition.start(self.styleDict[self.current_state()])
+        self.apply_shadow()
+        if self._icons and not self._is_active and not self._icon_constant_color:
+            color: str = "#898989" if self.isDark() else '#616161'
+            self.set_current_icon_color(color)
+        self.update()
+        if a0 is not None:
+            super().leaveEvent(a0)
+
+    def current_state(self):
+        if self._press:
+            return 'press'
+        elif self._hover:
+            return 'hover'
+        else:
+            return 'default'
+
+    def _label_font(self) -> QFont:
+        style: dict = self.transition.style
+        fnt = QFont(self.font())
+        fnt.setPixelSize(int(style["font-size"]))
+        if self.styleDict["default"]["font-family"]:
+            fnt.setFamily(self.styleDict["default"]["font-family"])
+        return fnt
+
+    def _icon_rect(self, contents: QRect) -> QRect:
+        if self._full_size_image:
+            return QRect(contents)
+        size: QSize = self._icon_size.boundedTo(contents.size())
+        return QRect(0, 0, size.width(), size.height())
+
+    def paint_body(self, painter: QPainter):
+        style: dict = self.transition.style
+        contents: QRect = self.rect().adjusted(self._margin, 0, -self._margin, 0)
+        fnt: QFont = self._label_font()
+        fm = QFontMetrics(fnt)
+        icon = self.current_icon()
+        icon_rect = self._icon_rect(contents) if icon else QRect()
+        text_width: int = fm.horizontalAdvance(self._text) if self._text else 0
+        spacing: int = ICON_SPACING if icon and self._text else 0
+        body_width: int = min(contents.width(),
+                              icon_rect.width() + spacing + text_width)
+        x: int = contents.x() + (contents.width() - body_width) // 2
+        if icon:
+            icon_x = x if self._icon_position == 'left' \
+                else x + body_width - icon_rect.width()
+            icon_rect.moveTo(icon_x, contents.y() + (contents.height() - icon_rect.height()) // 2)
+            color: str = self._icon_colors[self._icon_index]
+            pixmap = cached_pixmap(icon, icon_rect.width(), icon_rect.height(),
+                                   color, self.devicePixelRatioF())
+            painter.drawPixmap(icon_rect.topLeft(), pixmap)
+        if self._text:
+            text_rect = QRect(contents)
+            text_rect.setWidth(body_width - icon_rect.width() - spacing)
+            text_rect.moveLeft(x + (icon_rect.width() + spacing
+                                    if self._icon_position == 'left' else 0))
+            painter.setFont(fnt)
+            painter.setPen(QColor(style["color"]))
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter,
+                             fm.elidedText(self._text, Qt.TextElideMode.ElideRight,
+                                           text_rect.width()))
+
+    def apply_shadow(self) -> None:
+        """Show the shadow of the state the button is heading to."""
+        if self.is_flat:
+            return
+        style: dict = self.styleDict[self.current_state()]
+        update_shadow(self, int(style["drop-shadow-radius"]),
+                      int(style["border-radius"]),
+                      QColor(0, 0, 0, int(style["drop-shadow-alpha"])),
+                      style["drop-shadow-offset"])
+
+    @override
+    def paintEvent(self, e):
+        style: dict = self.transition.style
+        pt = QPainter()
+        pt.begin(self)
+        pt.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pw = 0 if self.is_flat else style["border-width"]
+        pt.setPen(QPen(QColor(style["border-color"]), pw))
+        pt.setBrush(QBrush(QColor(style["background-color"])))
+        r: int = min(int(style["border-radius"]), self.height() // 2)
+        pt.drawRoundedRect(1, 1, self.width() - 2, self.height() - 2, r, r)
+        self.paint_body(pt)
+        pt.end()
+
+
+class Widget(QWidget):
+    def __init__(self):
+        super().__init__()
+        assets = Path(__file__).parents[1] / 'assets'
+        self._layout = QHBoxLayout()
+        icons = [assets / 'svg' / 'dark.svg', assets / 'svg' / 'light.svg']
+        self.b = PaintedButton('hello', icons, flat=True, iterate_icons=True)
+        self.b.clicked.connect(self.on_pressed)
+        self._layout.addWidget(self.b)
+        self.setLayout(self._layout)
+        self.state = False
+
+    def on_pressed(self):
+        self.state = not self.state
+        light() if self.state else dark()
+
+
+if __name__ == '__main__':
+    app = QApplication([])
+    dark()
+    w = Widget()
+    w.show()
+    app.exec()
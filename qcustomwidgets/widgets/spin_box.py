@@ -1,8 +1,147 @@
+import operator
+import re
+from functools import lru_cache
+from typing import Callable
+from typing_extensions import override
 from PyQt6 import QtWidgets, QtGui, QtCore
 
 
+MAX_EXPRESSION_LENGTH = 256
+MAX_SHIFT = 1024
+_TOKEN = re.compile(r'\s*(?:(0[xX][0-9a-fA-F_]+|0[bB][01_]+|0[oO][0-7_]+|\d[\d_]*)'
+                    r'|(<<|>>|[-+*/&|^~()]))')
+
+
+def _shift_count(count: int) -> int:
+    if not 0 <= count <= MAX_SHIFT:
+        raise ValueError(f'shift count {count} is out of 0..{MAX_SHIFT}')
+    return count
+
+
+def _divide(a: int, b: int) -> int:
+    # rounds toward zero like int(a / b), without going through float
+    if b == 0:
+        raise ValueError('division by zero')
+    quotient: int = abs(a) // abs(b)
+    return quotient if (a < 0) == (b < 0) else -quotient
+
+
+_BINARY: dict[str, tuple[int, Callable[[int, int], int]]] = {
+    '|': (1, operator.or_),
+    '^': (2, operator.xor),
+    '&': (3, operator.and_),
+    '<<': (4, lambda a, b: a << _shift_count(b)),
+    '>>': (4, lambda a, b: a >> _shift_count(b)),
+    '+': (5, operator.add),
+    '-': (5, operator.sub),
+    '*': (6, operator.mul),
+    '/': (6, _divide),
+}
+_UNARY: dict[str, Callable[[int], int]] = {
+    '-': operator.neg,
+    '+': operator.pos,
+    '~': operator.invert,
+}
+
+
+def _tokenize(text: str) -> list[str | int]:
+    tokens: list[str | int] = []
+    pos: int = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            raise ValueError(f'unexpected {text[pos:].strip()[:10]!r}')
+        number, symbol = match.groups()
+        tokens.append(symbol if number is None else
+                      int(number, 10 if number.isdigit() else 0))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Precedence climbing over the tokens, operator priorities as in
+    Python."""
+    def __init__(self, tokens: list[str | int]) -> None:
+        self.tokens: list[str | int] = tokens
+        self.pos: int = 0
+
+    def peek(self) -> str | int | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self) -> str | int | None:
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def expression(self, min_priority: int = 1) -> int:
+        value: int = self.operand()
+        while True:
+            token = self.peek()
+            if not isinstance(token, str) or token not in _BINARY:
+                return value
+            priority, apply = _BINARY[token]
+            if priority < min_priority:
+                return value
+            self.pos += 1
+            value = apply(value, self.expression(priority + 1))
+
+    def operand(self) -> int:
+        token = self.take()
+        if isinstance(token, int):
+            return token
+        if token in _UNARY:
+            return _UNARY[token](self.operand())  # type: ignore
+        if token == '(':
+            value: int = self.expression()
+            if self.take() != ')':
+                raise ValueError('missing )')
+            return value
+        raise ValueError('unexpected end' if token is None else f'unexpected {token!r}')
+
+
+@lru_cache(maxsize=512)
+def evaluate(text: str) -> int:
+    """
+    Value of an integer expression typed into a spin box: decimal, ``0x``,
+    ``0b`` and ``0o`` literals, ``+ - * / << >> & | ^ ~`` with Python
+    priorities and parentheses. ``/`` rounds toward zero. Nothing is ever
+    executed, invalid or oversized input raises `ValueError`.
+    """
+    if len(text) > MAX_EXPRESSION_LENGTH:
+        raise ValueError('expression is too long')
+    parser = _Parser(_tokenize(text))
+    value: int = parser.expression()
+    if parser.peek() is not None:
+        raise ValueError(f'unexpected {parser.peek()!r}')
+    return value
+
+
+_text_widths: dict[tuple[str, int, bool], int] = {}
+
+
+def text_width(font: QtGui.QFont, digits: int, hex_mode: bool) -> int:
+    """Width of the widest `digits` long number in `font`, with the ``0x``
+    prefix in hex mode. Cached per font, digit count and mode."""
+    key: tuple[str, int, bool] = (font.key(), digits, hex_mode)
+    width: int | None = _text_widths.get(key)
+    if width is None:
+        fm = QtGui.QFontMetrics(font)
+        digit: int = max(fm.horizontalAdvance(char) for char in
+                         ('0123456789ABCDEF' if hex_mode else '0123456789'))
+        width = digit * digits + (fm.horizontalAdvance('0x') if hex_mode else 0)
+        _text_widths[key] = width
+    return width
+
+
 class SpinBox(QtWidgets.QAbstractSpinBox):
-    valueChanged = QtCore.pyqtSignal(int)
+    """
+    Integer spin box without the 32-bit limit of `QSpinBox`: values are
+    Python ints and `valueChanged` sends them as objects. Typed text goes
+    through `evaluate`, Ctrl+H toggles hex display. `set_register` makes it
+    a register editor with a bit width, signedness and a bit-field mask.
+    """
+    valueChanged = QtCore.pyqtSignal(object)
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self.editingFinished.connect(self.on_editing_finished)
@@ -12,55 +151,136 @@ class SpinBox(QtWidgets.QAbstractSpinBox):
         self.min_val: int = 0
         self.max_val: int = 0xFFFFFFFF
         self.is_hex_mode: bool = False
-        QtGui.QShortcut(QtGui.QKeySequence('Ctrl+H'), self,
-                                           self.toggle_hex_mode,
-                                           context=QtCore.Qt.ShortcutContext.WidgetShortcut)
+        self.bits: int | None = None
+        self.mask: int | None = None
+        self._hex_digits: int = 2
         self.setValue(0)
         self.setMaximum(self.max_val)
         self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum,
                            QtWidgets.QSizePolicy.Policy.Maximum)
 
+    def set_register(self, bits: int = 64, signed: bool = False,
+                     mask: int | None = None, hex_mode: bool = True) -> None:
+        """
+        Edit a `bits` wide register value. In an unsigned register typed
+        negative results wrap around, so ``~0`` sets every bit. With `mask`
+        only the bits set in it may change: values with other bits set are
+        rejected and the arrows count through the mask bits.
+        """
+        self.bits = bits
+        self.mask = mask
+        self.is_hex_mode = hex_mode
+        self._hex_digits = (bits + 3) // 4
+        self.step_size = mask & -mask if mask else 1
+        if signed:
+            self.setRange(-(1 << bits - 1), (1 << bits - 1) - 1)
+        else:
+            self.setRange(0, (1 << bits) - 1)
+        if mask is not None and not self.accepts(self.last_valid_val):
+            self.setValue(self.last_valid_val & mask)
+        self._set_val(self.last_valid_val)
+
+    def accepts(self, val: int) -> bool:
+        if not self.min_val <= val <= self.max_val:
+            return False
+        if self.mask is None or self.bits is None:
+            return True
+        return val & ~self.mask & ((1 << self.bits) - 1) == 0
+
+    def stepped(self, val: int, steps: int) -> int | None:
+        """
+        `val` moved by `steps` arrow steps, or None past the range. With a
+        mask the field counts up and down through the mask bits only, the
+        bits outside of it are kept.
+        """
+        if self.mask is None or self.bits is None:
+            new: int = val + steps * self.step_size
+        else:
+            width: int = (1 << self.bits) - 1
+            mask: int = self.mask & width
+            word: int = val & width
+            for _ in range(abs(steps)):
+                # carry through the bits outside the mask
+                field: int = ((word | ~mask) + 1 if steps > 0
+                              else (word & mask) - 1) & mask
+                word = word & ~mask | field
+            new = word - (1 << self.bits) \
+                if self.min_val < 0 and word >> self.bits - 1 else word
+            if steps and (new > val) != (steps > 0):
+                # the field wrapped around
+                return None
+        return new if self.accepts(new) else None
+
     def toggle_hex_mode(self) -> None:
         self.is_hex_mode = not self.is_hex_mode
         self._set_val(self.last_valid_val)
+        self._update_width()
+
+    @override
+    def keyPressEvent(self, e: QtGui.QKeyEvent | None) -> None:
+        # handled here instead of a QShortcut per instance, which every
+        # spin box of a register table would add to the shortcut map
+        if e and e.key() == QtCore.Qt.Key.Key_H and \
+                e.modifiers() == QtCore.Qt.KeyboardModifier.ControlModifier:
+            self.toggle_hex_mode()
+            e.accept()
+            return
+        super().keyPressEvent(e)
 
     def stepEnabled(self) -> QtWidgets.QAbstractSpinBox.StepEnabledFlag:
-        if self.last_valid_val != self.max_val and self.last_valid_val != self.min_val:
-            return super().StepEnabledFlag.StepDownEnabled | super().StepEnabledFlag.StepUpEnabled
-        elif self.last_valid_val == self.max_val:
-            return super().StepEnabledFlag.StepDownEnabled
-        elif self.last_valid_val == self.min_val:
-            return super().StepEnabledFlag.StepUpEnabled
-        else:
-            return super().StepEnabledFlag.StepNone
+        flags = super().StepEnabledFlag.StepNone
+        if self.stepped(self.last_valid_val, 1) is not None:
+            flags |= super().StepEnabledFlag.StepUpEnabled
+        if self.stepped(self.last_valid_val, -1) is not None:
+            flags |= super().StepEnabledFlag.StepDownEnabled
+        return flags
 
     def on_editing_finished(self) -> None:
-        text: str = self.text()
         try:
-            val = eval(text)
-            if isinstance(val, (int, float)):
-                self.setValue(int(val))
-            else:
-                raise ValueError
-        except Exception:
+            val: int = evaluate(self.text())
+        except (ValueError, RecursionError):
+            self._set_val(self.last_valid_val)
+            return
+        if self.bits is not None and self.min_val == 0 and -(1 << self.bits) <= val < 0:
+            val &= (1 << self.bits) - 1
+        if self.accepts(val):
+            self.setValue(val)
+        else:
             self._set_val(self.last_valid_val)
 
     def _set_val(self, val: int) -> None:
         if self.is_hex_mode:
             if val >= 0:
-                self._line_edit.setText(f'0x{val:02X}')
+                self._line_edit.setText(f'0x{val:0{self._hex_digits}X}')
             else:
-                self._line_edit.setText(f'- 0x{-val:02X}')
+                self._line_edit.setText(f'- 0x{-val:0{self._hex_digits}X}')
         else:
             self._line_edit.setText(f'{val}')
 
+    def _digits(self, val: int) -> int:
+        if self.is_hex_mode:
+            return max(self._hex_digits, len(f'{abs(val):X}')) + 2 * (val < 0)
+        return len(f'{val}')
+
+    def _update_width(self) -> None:
+        digits: int = max(self._digits(self.min_val), self._digits(self.max_val))
+        self.setMinimumWidth(text_width(self.font(), digits, self.is_hex_mode) + 30)
+
+    @override
+    def changeEvent(self, e: QtCore.QEvent | None) -> None:
+        super().changeEvent(e)
+        if e and e.type() == e.Type.FontChange:
+            self._update_width()
+
+    @override
     def focusOutEvent(self, e: QtGui.QFocusEvent | None) -> None:
         self.on_editing_finished()
         return super().focusOutEvent(e)
 
     def stepBy(self, steps: int) -> None:
-        if self.min_val <= self.last_valid_val + steps <= self.max_val:
-            self.last_valid_val += steps
+        val: int | None = self.stepped(self.last_valid_val, steps)
+        if val is not None:
+            self.last_valid_val = val
             self._set_val(self.last_valid_val)
             self.valueChanged.emit(self.last_valid_val)
 
@@ -72,16 +292,16 @@ class SpinBox(QtWidgets.QAbstractSpinBox):
         self.min_val = min_val
         if self.last_valid_val <= self.min_val:
             self.setValue(self.min_val)
+        self._update_width()
 
     def setMaximum(self, max_val: int) -> None:
         self.max_val = max_val
         if self.last_valid_val >= self.max_val:
             self.setValue(self.max_val)
-        size: int = self.fontMetrics().boundingRect(f'{self.max_val}').width()
-        self.setMinimumWidth(size + 30)
+        self._update_width()
 
     def setValue(self, val: int) -> None:
-        if self.min_val <= val <= self.max_val:
+        if self.accepts(val):
             if self.last_valid_val != val:
                 self.valueChanged.emit(val)
             self.last_valid_val = val
@@ -98,6 +318,13 @@ if __name__ == '__main__':
     w.setLayout(_l)
     _l.addWidget(SpinBox())
     _l.addWidget(SpinBox())
+    register = SpinBox()
+    register.set_register(64)
+    register.valueChanged.connect(print)
+    _l.addWidget(register)
+    field = SpinBox()
+    field.set_register(16, mask=0x0FF0)
+    _l.addWidget(field)
     sb = QtWidgets.QSpinBox()
     sb.setMaximum(0xFFFF)
     sb.setSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum,
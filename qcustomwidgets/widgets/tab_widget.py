@@ -1,21 +1,50 @@
+import json
+import time
+from bisect import bisect_left
+from functools import partial
+from math import sqrt
 from pathlib import Path
 from uuid import uuid4
-from typing import Literal
+from typing import Any, Callable, Literal, Sequence
 from PyQt6 import QtCore, QtGui, QtWidgets
 from qcustomwidgets.widgets.image_box import ImageBox
 from qcustomwidgets.widgets.button import Button
+from qcustomwidgets.widgets.button_pool import ButtonPool
 from qcustomwidgets.style.palettes import dark
 from qcustomwidgets.style.stylesheets import stylesheet
 from qcustomwindow import CustomWindow
 
 
 TAB_BTN_POS = QtWidgets.QTabBar.ButtonPosition.LeftSide
+tab_buttons = ButtonPool(flat=True, side_margins=0)
+SESSION_VERSION = 1
+
+
+def drag_preview(widget: QtWidgets.QWidget, max_pixels: int,
+                 opacity: float = 1.0) -> QtGui.QPixmap:
+    """Render `widget` downscaled to at most `max_pixels` pixels, applying
+    `opacity` while painting."""
+    w, h = max(1, widget.width()), max(1, widget.height())
+    scale: float = min(1.0, sqrt(max_pixels / (w * h)))
+    pixmap = QtGui.QPixmap(max(1, int(w * scale)), max(1, int(h * scale)))
+    pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+    painter = QtGui.QPainter(pixmap)
+    painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform)
+    painter.setOpacity(opacity)
+    painter.scale(scale, scale)
+    widget.render(painter, QtCore.QPoint(), QtGui.QRegion(),
+                  QtWidgets.QWidget.RenderFlag.DrawWindowBackground |
+                  QtWidgets.QWidget.RenderFlag.DrawChildren)
+    painter.end()
+    return pixmap
 
 
 class TabBar(QtWidgets.QTabBar):
     onDetachTabSignal = QtCore.pyqtSignal(int, QtCore.QPoint)
     onMoveTabSignal = QtCore.pyqtSignal(int, int)
     detachedTabDropSignal = QtCore.pyqtSignal(str, int, QtCore.QPoint)
+    dragPreviewPixels: int = 480 * 320
+    dragPreviewOpacity: float = 0.85
 
     def __init__(self, parent=None,
                  position: Literal['left', 'right', 'top', 'bottom'] = 'top'):
@@ -87,14 +116,10 @@ class TabBar(QtWidgets.QTabBar):
             parent_widget: QtWidgets.QTabWidget = self.parentWidget()  # type: ignore
             if not parent_widget:
                 return
-            pixmap = parent_widget.currentWidget().grab()  # type: ignore
-            targetPixmap = QtGui.QPixmap(pixmap.size())
-            targetPixmap.fill(QtCore.Qt.GlobalColor.transparent)
-            painter = QtGui.QPainter(targetPixmap)
-            painter.setOpacity(0.85)
-            painter.drawPixmap(0, 0, pixmap)
-            painter.end()
-            drag.setPixmap(targetPixmap)
+            page: QtWidgets.QWidget | None = parent_widget.currentWidget()
+            if page is not None:
+                drag.setPixmap(drag_preview(page, self.dragPreviewPixels,
+                                            self.dragPreviewOpacity))
 
             # Initiate the drag
             dropAction = drag.exec(QtCore.Qt.DropAction.MoveAction,
@@ -147,28 +172,53 @@ class TabBar(QtWidgets.QTabBar):
         index = self.tabAt(tabDropPos)
         self.detachedTabDropSignal.emit(name, index, dropPos)
 
+    def _tab_pixmap(self, opt: QtWidgets.QStyleOptionTab) -> QtGui.QPixmap:
+        """Tab shape with its label rotated by 90 degrees, cached by text,
+        state, size, palette and font."""
+        size: QtCore.QSize = opt.rect.size()
+        dpr: float = self.devicePixelRatioF()
+        key: str = (f'qcw-tab:{opt.text}:{opt.state.value}:{opt.position.value}:'
+                    f'{opt.selectedPosition.value}:{size.width()}x{size.height()}'
+                    f'@{dpr}:{opt.palette.cacheKey()}:{self.font().key()}')
+        pixmap: QtGui.QPixmap | None = QtGui.QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+        pixmap = QtGui.QPixmap(size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        painter = QtGui.QPainter(pixmap)
+        painter.setFont(self.font())
+        style: QtWidgets.QStyle = self.style()  # type: ignore
+        opt.rect = QtCore.QRect(QtCore.QPoint(), size)
+        style.drawControl(QtWidgets.QStyle.ControlElement.CE_TabBarTabShape,
+                          opt, painter, self)
+        s: QtCore.QSize = size.transposed()
+        r = QtCore.QRect(QtCore.QPoint(), s)
+        c: QtCore.QPoint = opt.rect.center()
+        r.moveCenter(c)
+        opt.rect = r
+        painter.translate(c)
+        painter.rotate(90)
+        painter.translate(-c)
+        style.drawControl(QtWidgets.QStyle.ControlElement.CE_TabBarTabLabel,
+                          opt, painter, self)
+        painter.end()
+        QtGui.QPixmapCache.insert(key, pixmap)
+        return pixmap
+
     def paintEvent(self, a0) -> None:
         if self.position in ['left', 'right']:
-            painter = QtWidgets.QStylePainter(self)
+            painter = QtGui.QPainter(self)
             opt = QtWidgets.QStyleOptionTab()
+            dirty: QtCore.QRect = a0.rect() if a0 else self.rect()
 
             for i in range(self.count()):
+                rect: QtCore.QRect = self.tabRect(i)
+                if not rect.intersects(dirty):
+                    continue
                 self.initStyleOption(opt, i)
-                painter.drawControl(QtWidgets.QStyle.ControlElement.CE_TabBarTabShape, opt)
-                painter.save()
-
-                s: QtCore.QSize = opt.rect.size()
-                s.transpose()
-                r = QtCore.QRect(QtCore.QPoint(), s)
-                r.moveCenter(opt.rect.center())
-                opt.rect = r
-
-                c: QtCore.QPoint = self.tabRect(i).center()
-                painter.translate(c)
-                painter.rotate(90)
-                painter.translate(-c)
-                painter.drawControl(QtWidgets.QStyle.ControlElement.CE_TabBarTabLabel, opt)
-                painter.restore()
+                painter.drawPixmap(rect.topLeft(), self._tab_pixmap(opt))
+            painter.end()
         else:
             super().paintEvent(a0)
 
@@ -244,6 +294,76 @@ class DetachedTab(CustomWindow):
                 return False
 
 
+def _valid_session(session: Any) -> bool:
+    """Check the shape of a parsed session before anything is applied."""
+    if not isinstance(session, dict) or session.get('v') != SESSION_VERSION:
+        return False
+    tabs = session.get('tabs', [])
+    if not isinstance(tabs, list) or not all(isinstance(key, str) for key in tabs):
+        return False
+    if not isinstance(session.get('current'), (str, type(None))):
+        return False
+    detached = session.get('detached', [])
+    if not isinstance(detached, list):
+        return False
+    for item in detached:
+        if not isinstance(item, list) or len(item) != 2 or \
+                not isinstance(item[0], str) or not isinstance(item[1], list) or \
+                len(item[1]) != 4 or \
+                not all(type(v) is int for v in item[1]):
+            return False
+    return True
+
+
+def _longest_increasing(values: list[int]) -> set[int]:
+    """Values of one longest strictly increasing subsequence."""
+    tails: list[int] = []
+    tail_pos: list[int] = []
+    prev: list[int] = [-1] * len(values)
+    for i, value in enumerate(values):
+        k: int = bisect_left(tails, value)
+        if k == len(tails):
+            tails.append(value)
+            tail_pos.append(i)
+        else:
+            tails[k] = value
+            tail_pos[k] = i
+        prev[i] = tail_pos[k - 1] if k else -1
+    result: set[int] = set()
+    i = tail_pos[-1] if tail_pos else -1
+    while i != -1:
+        result.add(values[i])
+        i = prev[i]
+    return result
+
+
+class LazyTabPage(QtWidgets.QWidget):
+    """Placeholder tab page which builds its content on first use."""
+    def __init__(self, factory: Callable[[], QtWidgets.QWidget],
+                 parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.factory: Callable[[], QtWidgets.QWidget] = factory
+        self.content: QtWidgets.QWidget | None = None
+        self.last_visit: float = time.monotonic()
+        self._layout = QtWidgets.QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+    def is_loaded(self) -> bool:
+        return self.content is not None
+
+    def load(self) -> QtWidgets.QWidget:
+        if self.content is None:
+            self.content = self.factory()
+            self._layout.addWidget(self.content)
+        return self.content
+
+    def unload(self) -> None:
+        if self.content is not None:
+            self._layout.removeWidget(self.content)
+            self.content.deleteLater()
+            self.content = None
+
+
 class TabWidget(QtWidgets.QTabWidget):
     def __init__(self,
                  tab_bar_position: Literal['top', 'bottom',
@@ -260,6 +380,7 @@ class TabWidget(QtWidgets.QTabWidget):
         elif tab_bar_position == 'right':
             self.setTabPosition(QtWidgets.QTabWidget.TabPosition.East)
         self.currentChanged.connect(self.set_active_tab)
+        self.currentChanged.connect(self._on_current_changed)
 
         self.detachedTabs = {}
         QtGui.QShortcut(QtGui.QKeySequence('Ctrl+Shift+K'), self,
@@ -269,22 +390,35 @@ class TabWidget(QtWidgets.QTabWidget):
         # Close all detached tabs if the application is closed explicitly
         QtWidgets.QApplication.instance().aboutToQuit.connect(self.closeDetachedTabs)  # type: ignore
         self.freezed_tabs: bool = False
+        self.button_pool: ButtonPool = tab_buttons
+        self.lazy_prefetch: bool = False
+        self.prefetch_delay: int = 300
+        self._current_page: QtWidgets.QWidget | None = None
+        self._active_tab: tuple[QtWidgets.QWidget | None, Button | None] = (None, None)
+        self._unload_after: float | None = None
+        self._unload_timer = QtCore.QTimer(self)
+        self._unload_timer.timeout.connect(self.unload_stale_tabs)
+        # one timer owned by the widget: restarted on every tab change and
+        # stopped with the widget, so no callback outlives it
+        self._prefetch_timer = QtCore.QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.timeout.connect(self._prefetch)
 
     def setMovable(self, movable):
         pass
 
     def set_active_tab(self, val: int):
-        c = self.count()
-        if not c:
-            return
-        buttons = self.tab_bar.get_tab_buttons_list()
-        for i, btn in enumerate(buttons):
-            if btn:
-                btn.enterEvent(None)
-                btn._is_active = (val == i)
-                if val == i:
-                    btn.enterEvent(None)
-                btn.leaveEvent(None)
+        # only the previously and the newly active buttons are restyled
+        button: Button | None = self.tab_bar.tabButton(val, TAB_BTN_POS)  # type: ignore
+        old_page, old_button = self._active_tab
+        if old_button is not None and old_button is not button:
+            old_index: int = self.indexOf(old_page) if old_page else -1
+            if old_index != -1 and \
+                    self.tab_bar.tabButton(old_index, TAB_BTN_POS) is old_button:
+                old_button.set_active(False)
+        if button is not None and not button._is_active:
+            button.set_active(True)
+        self._active_tab = (self.widget(val), button)
 
     def addTabCustom(self, widget: QtWidgets.QWidget | None, label: str,
                      icon: Button | ImageBox | str | Path | None = None,
@@ -295,10 +429,9 @@ class TabWidget(QtWidgets.QTabWidget):
         else:
             index = self.insertTab(insert_at, widget, None)
         if not isinstance(icon, Button):
-            btn = Button(label,
-                         [icon] if icon is not None else None,
-                         flat=True,
-                         tooltip=tooltip, side_margins=0)
+            btn = self.button_pool.acquire(label,
+                                           [icon] if icon is not None else None,
+                                           tooltip)
             btn.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
             btn.setMinimumSize(0, 0)
         else:
@@ -307,34 +440,97 @@ class TabWidget(QtWidgets.QTabWidget):
             btn.setFixedSize(40, 40)
             btn.setIconSize(30, 30)
             btn.setContentsMargins(5, 5, 5, 5)
-        btn.pressed.connect(lambda: self.setCurrentIndex(index))
+        btn.pressed.connect(partial(self.setCurrentWidget, self.widget(index)))
         self.tab_bar.setTabButton(index, TAB_BTN_POS, btn)
         self.tab_bar.setTabToolTip(index, btn.toolTip())
         return index
 
 
+    def removeTab(self, index: int) -> None:
+        # QTabBar deletes tab buttons on removal, hand pooled ones back instead
+        button = self.tab_bar.tabButton(index, TAB_BTN_POS)
+        pooled: bool = self.button_pool.owns(button)  # type: ignore
+        if pooled:
+            self.tab_bar.setTabButton(index, TAB_BTN_POS, None)
+        super().removeTab(index)
+        if pooled and not self.button_pool.release(button):  # type: ignore
+            # the pool is full and the tab bar no longer owns it
+            button.deleteLater()  # type: ignore
+
+    def addLazyTab(self, factory: Callable[[], QtWidgets.QWidget], label: str,
+                   icon: Button | ImageBox | str | Path | None = None,
+                   tooltip: str | None = None,
+                   insert_at: int | None = None) -> int:
+        """Add a tab whose page is built by `factory` when the tab is first
+        activated or detached."""
+        page = LazyTabPage(factory)
+        index: int = self.addTabCustom(page, label, icon, tooltip, insert_at)
+        if index == self.currentIndex():
+            page.load()
+        return index
+
+    def set_unload_policy(self, seconds: float | None) -> None:
+        """Unload lazy pages which were not visited for `seconds`. The page
+        is rebuilt by its factory when the tab is activated again."""
+        self._unload_after = seconds
+        if seconds is None:
+            self._unload_timer.stop()
+        else:
+            self._unload_timer.start(int(max(1.0, seconds / 2) * 1000))
+
+    def unload_stale_tabs(self) -> None:
+        if self._unload_after is None:
+            return
+        deadline: float = time.monotonic() - self._unload_after
+        current = self.currentWidget()
+        for i in range(self.count()):
+            page = self.widget(i)
+            if isinstance(page, LazyTabPage) and page is not current \
+                    and page.is_loaded() and page.last_visit < deadline:
+                page.unload()
+
+    def _on_current_changed(self, index: int) -> None:
+        now: float = time.monotonic()
+        if isinstance(self._current_page, LazyTabPage):
+            self._current_page.last_visit = now
+        page = self.widget(index)
+        self._current_page = page
+        if isinstance(page, LazyTabPage):
+            page.last_visit = now
+            page.load()
+        if self.lazy_prefetch and index + 1 < self.count():
+            following = self.widget(index + 1)
+            if isinstance(following, LazyTabPage) and not following.is_loaded():
+                self._prefetch_timer.start(self.prefetch_delay)
+
+    def _prefetch(self) -> None:
+        """Load the page after the current one if it is still lazy."""
+        index: int = self.currentIndex()
+        page = self.widget(index + 1) if index != -1 else None
+        if isinstance(page, LazyTabPage) and not page.is_loaded():
+            page.load()
+            page.last_visit = time.monotonic()
+
     @QtCore.pyqtSlot(int, int)
     def moveTab(self, fromIndex: int, toIndex: int):
-        widget = self.widget(fromIndex)
-        button: Button | None = self.tab_bar.tabButton(fromIndex, TAB_BTN_POS)  # type: ignore
-        self.tab_bar.setTabButton(fromIndex, TAB_BTN_POS, None)
-        icon = self.tabIcon(fromIndex)
-        text = self.tabText(fromIndex)
-
-        self.removeTab(fromIndex)
-        if button:
-            if not text:
-                text = button.text()
-            if len(button._icons):
-                self.addTabCustom(widget, text, button, insert_at=toIndex)
-            else:
-                self.addTabCustom(widget, text, insert_at=toIndex)
-        else:
-            self.insertTab(toIndex, widget, icon, text)
+        """Move a tab in place: its page, button and connections are kept."""
+        if not 0 <= fromIndex < self.count():
+            return
+        if not 0 <= toIndex < self.count():
+            toIndex = self.count() - 1
+        if fromIndex != toIndex:
+            self.tab_bar.moveTab(fromIndex, toIndex)
         self.setCurrentIndex(toIndex)
 
     @QtCore.pyqtSlot(int, QtCore.QPoint)
     def detachTab(self, index: int, point: QtCore.QPoint):
+        detachedTab = self._detach(index)
+        if detachedTab is not None:
+            detachedTab.move(point)
+            detachedTab.show()
+
+    def _detach(self, index: int) -> 'DetachedTab | None':
+        """Move the page at `index` into a new, not yet shown DetachedTab."""
         name: str = self.tabText(index)
         icon = self.tabIcon(index)
         button: Button | None = self.tab_bar.tabButton(index, TAB_BTN_POS)  # type: ignore
@@ -344,7 +540,9 @@ class TabWidget(QtWidgets.QTabWidget):
         contentWidget = self.widget(index)
         # button = button or icon
         if not contentWidget:
-            return
+            return None
+        if isinstance(contentWidget, LazyTabPage):
+            contentWidget.load()
         contentWidgetRect = contentWidget.frameGeometry()
         # Create a new detached tab window
         detachedTab = DetachedTab(name, contentWidget, button)
@@ -354,12 +552,11 @@ class TabWidget(QtWidgets.QTabWidget):
         # detachedTab.resize(600, 600)
         detachedTab.onCloseSignal.connect(self.attachTab)
         detachedTab.onDropSignal.connect(self.tab_bar.detachedTabDrop)
-        detachedTab.move(point)
-        detachedTab.show()
         tab_id = str(uuid4())
         detachedTab.setObjectName(tab_id)
         # Create a reference to maintain access to the detached tab
         self.detachedTabs[tab_id] = detachedTab
+        return detachedTab
 
     def attachTab(self, contentWidget, tab_id: str, name: str,
                   icon: Button | None, insertAt=None):
@@ -378,33 +575,53 @@ class TabWidget(QtWidgets.QTabWidget):
                 index: int = self.addTabCustom(contentWidget, name, icon,
                                                insert_at=old_index)
             else:
+                if not self.button_pool.release(icon):
+                    icon.deleteLater()
                 index = self.addTabCustom(contentWidget, name, insert_at=old_index)
 
         if index > -1:
             self.setCurrentIndex(index)
 
-    def _get_index_order(self):
-        index_order = {}
-        for current_index in range(self.count()):
-            if hasattr(self.widget(current_index), '_initial_tab_index'):
-                initial_index = getattr(self.widget(current_index), '_initial_tab_index')
-                if initial_index != current_index:
-                    index_order[initial_index] = current_index
-        return index_order
-
     def sort_tabs(self):
-        index_order = self._get_index_order()
-        if not index_order:
-            return
-        initial_index = list(index_order.keys())[0]
-        from_index = index_order.pop(initial_index)
-        to_index = initial_index
-        if self.widget(to_index):
-            self.moveTab(from_index, to_index)
-        else:
-            self.moveTab(from_index, abs((self.count() - 1) - to_index))
-        if len(index_order):
-            return self.sort_tabs()
+        """Restore the order saved by `freeze_tabs`."""
+        pages = [self.widget(i) for i in range(self.count())]
+        keys = {id(page): (getattr(page, '_initial_tab_index', i),
+                           not hasattr(page, '_initial_tab_index'), i)
+                for i, page in enumerate(pages)}
+        self.reorder_tabs(sorted(pages, key=lambda page: keys[id(page)]))
+
+    def reorder_tabs(self, pages: Sequence[QtWidgets.QWidget | None]) -> int:
+        """
+        Reorder tabs so that their pages follow `pages` (pages missing from
+        it keep their relative order after the listed ones). Tabs staying in
+        the longest already ordered run are not touched, the others are moved
+        with `QTabBar.moveTab`, so pages and tab buttons are kept as is.
+        Returns the number of moves.
+        """
+        order: list[int] = []
+        rank: dict[int, int] = {id(page): r for r, page in enumerate(pages)}
+        for i in range(self.count()):
+            order.append(rank.setdefault(id(self.widget(i)), len(rank)))
+        kept: set[int] = _longest_increasing(order)
+        settled: set[int] = set(kept)
+        moves: int = 0
+        self.setUpdatesEnabled(False)
+        try:
+            for r in sorted(set(order) - kept):
+                from_index: int = order.index(r)
+                order.pop(from_index)
+                to_index: int = 0
+                for j, other in enumerate(order):
+                    if other < r and other in settled:
+                        to_index = j + 1
+                order.insert(to_index, r)
+                settled.add(r)
+                if from_index != to_index:
+                    self.tab_bar.moveTab(from_index, to_index)
+                    moves += 1
+        finally:
+            self.setUpdatesEnabled(True)
+        return moves
 
     def removeTabByName(self, name):
         attached = False
@@ -452,6 +669,86 @@ class TabWidget(QtWidgets.QTabWidget):
             setattr(w, '_initial_tab_index', i)
 
 
+    def tab_key(self, index: int) -> str:
+        """Name identifying a tab in saved sessions: the page's objectName,
+        the tab text or the tab button's text or tooltip."""
+        page = self.widget(index)
+        if page is not None and page.objectName():
+            return page.objectName()
+        if self.tabText(index):
+            return self.tabText(index)
+        button: Button | None = self.tab_bar.tabButton(index, TAB_BTN_POS)  # type: ignore
+        if button is not None:
+            return button.text() or button.toolTip() or ''
+        return ''
+
+    @staticmethod
+    def _detached_key(detachedTab: DetachedTab) -> str:
+        return detachedTab.contentWidget.objectName() or detachedTab.title_label
+
+    def save_session(self) -> str:
+        """
+        Serialize tab order, the current tab and detached windows with their
+        geometry into a compact JSON string for `restore_session`.
+        """
+        detached: list = []
+        for detachedTab in self.detachedTabs.values():
+            g: QtCore.QRect = detachedTab.geometry()
+            detached.append([self._detached_key(detachedTab),
+                             [g.x(), g.y(), g.width(), g.height()]])
+        current: int = self.currentIndex()
+        return json.dumps({'v': SESSION_VERSION,
+                           'tabs': [self.tab_key(i) for i in range(self.count())],
+                           'current': self.tab_key(current) if current != -1 else None,
+                           'detached': detached}, separators=(',', ':'))
+
+    def restore_session(self, data: str | bytes) -> bool:
+        """
+        Apply a session saved by `save_session` to the tabs added so far:
+        reorder them in one pass, detach the saved windows without showing
+        intermediate states and activate the saved tab. Lazy pages are only
+        built for the current tab and the detached windows.
+        Returns False if `data` is not a valid session.
+        """
+        try:
+            session: dict = json.loads(data)
+        except ValueError:
+            return False
+        if not _valid_session(session):
+            return False
+        pages: dict[str, QtWidgets.QWidget] = {}
+        for i in range(self.count()):
+            pages.setdefault(self.tab_key(i), self.widget(i))  # type: ignore
+        windows: dict[str, DetachedTab] = {self._detached_key(w): w
+                                           for w in self.detachedTabs.values()}
+        restored: list[DetachedTab] = []
+        previous: QtWidgets.QWidget | None = self.currentWidget()
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            self.reorder_tabs([pages[key] for key in session.get('tabs', [])
+                               if key in pages])
+            for key, (x, y, w, h) in session.get('detached', []):
+                detachedTab: DetachedTab | None = windows.get(key)
+                if detachedTab is None and key in pages:
+                    detachedTab = self._detach(self.indexOf(pages.pop(key)))
+                    if detachedTab is None:
+                        continue
+                    restored.append(detachedTab)
+                if detachedTab is not None:
+                    detachedTab.setGeometry(x, y, w, h)
+            current: QtWidgets.QWidget | None = pages.get(session.get('current'))  # type: ignore
+            if current is not None and self.indexOf(current) != -1:
+                self.setCurrentWidget(current)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        if self.currentWidget() is not previous:
+            self.currentChanged.emit(self.currentIndex())
+        for detachedTab in restored:
+            detachedTab.show()
+        return True
+
 if __name__ == '__main__':
     from qcustomwindow import CustomWindow
     app = QtWidgets.QApplication([])